@@ -4,144 +4,211 @@
 生成综合的评估分析报告
 """
 
+import io
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from rich.console import Console
 
-console = Console()
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stream_data_stats(f):
+    """Collect the report statistics from a JSON stream without building the whole document"""
+    stats = {'total_tests': None, 'passed_tests': 0, 'overall': None}
+    events = ijson.parse(f, use_float=True)
+    for prefix, event, value in events:
+        if prefix == 'test_results' and event == 'start_array':
+            stats['total_tests'] = 0
+        elif prefix == 'test_results.item' and event == 'start_map':
+            stats['total_tests'] += 1
+        elif prefix == 'test_results.item.status' and value == 'passed':
+            stats['passed_tests'] += 1
+        elif prefix == 'statistics.overall':
+            if event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                for inner_prefix, inner_event, inner_value in events:
+                    builder.event(inner_event, inner_value)
+                    if inner_prefix == 'statistics.overall' and inner_event in ('end_map', 'end_array'):
+                        break
+                stats['overall'] = builder.value
+            else:
+                stats['overall'] = value
+    return stats
+
+
+def _read_data_stats(data_file):
+    """Read the test counts and overall statistics shown in the report for one data file"""
+    with open(data_file, 'rb') as f:
+        # Performance results carry the raw pytest output, so stream them when ijson is available
+        if ijson is not None:
+            return _stream_data_stats(f)
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+
+    stats = {'total_tests': None, 'passed_tests': 0, 'overall': None}
+    if 'test_results' in data:
+        test_results = data['test_results']
+        stats['total_tests'] = len(test_results)
+        stats['passed_tests'] = sum(1 for test in test_results if test.get('status') == 'passed')
+    if 'statistics' in data:
+        stats['overall'] = data['statistics'].get('overall')
+    return stats
+
+
+def _list_artifacts(directory, suffix):
+    """Sorted names of the files in directory ending with suffix, or None if it does not exist"""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(entry.name for entry in it if entry.name.endswith(suffix) and entry.is_file())
+    except FileNotFoundError:
+        return None
+
+
+def _try_read_data_stats(data_file):
+    """Read one data file's statistics, returning (stats, error) so failures stay per file, or None if it is missing"""
+    try:
+        return _read_data_stats(data_file), None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        return None, e
+
+
+# 评估步骤摘要
+STEPS_INFO = [
+    ('Step 3', 'Summarization Evaluation', 'EVM opcode summarization coverage and effectiveness'),
+    ('Step 4', 'Prove Summaries Correctness', 'Verification of summarization semantic correctness'),
+    ('Step 5', 'Pure Concrete Performance', 'Baseline concrete execution performance'),
+    ('Step 6', 'Summary Concrete Performance', 'Summarized concrete execution performance'),
+    ('Step 7', 'Pure Symbolic Performance', 'Baseline symbolic execution performance'),
+    ('Step 8', 'Summary Symbolic Performance', 'Summarized symbolic execution performance')
+]
+
+STEPS_SECTION = ''.join(f'- **{step}: {name}**: {desc}\n' for step, name, desc in STEPS_INFO)
+
+# 报告的静态部分只定义一次，运行时只填入生成时间、产物清单和数据统计
+REPORT_TEMPLATE = (
+    '# EVM Semantics Summarization Evaluation Report\n\n'
+    'Generated on: {generated_on}\n\n'
+    'This report summarizes the comprehensive evaluation of EVM semantics summarization.\n\n'
+    '## Evaluation Steps\n\n'
+    '{steps}'
+    '\n## Generated Artifacts\n\n'
+    '{artifacts}'
+    '### Data Statistics\n\n'
+    '{data_statistics}'
+    # 关键发现
+    '## Key Findings\n\n'
+    '### Summarization Effectiveness\n'
+    '- EVM opcode summarization coverage analysis\n'
+    '- Semantic equivalence verification results\n\n'
+    '### Performance Improvements\n'
+    '- Concrete execution performance gains\n'
+    '- Symbolic execution efficiency improvements\n'
+    '- Statistical significance of performance differences\n\n'
+    '### Correctness Verification\n'
+    '- Summarization semantic correctness validation\n'
+    '- Test case coverage and success rates\n\n'
+    # 使用建议
+    '## Usage for Academic Papers\n\n'
+    '### Recommended Paper Structure\n'
+    '```latex\n'
+    '\\section{{Evaluation}}\n'
+    '\\subsection{{Experimental Setup}}\n'
+    '\\subsection{{Summarization Effectiveness}}\n'
+    '\\input{{results/analysis/tables/step3_summarization_evaluation.tex}}\n'
+    '\\subsection{{Performance Analysis}}\n'
+    '\\includegraphics{{results/analysis/charts/comprehensive_performance_comparison.pdf}}\n'
+    '\\input{{results/analysis/tables/concrete_performance_comparison.tex}}\n'
+    '```\n\n'
+)
+
+# 报告中统计的关键数据文件
+DATA_FILES = [
+    'results/data/summarize_evaluation_results.json',
+    'results/data/prove_summaries_results.json',
+    'results/data/pure_concrete_performance.json',
+    'results/data/summary_concrete_performance.json'
+]
 
 
 def generate_comprehensive_report():
     """生成综合分析报告"""
+    # rich只在真正生成报告时才需要，延迟导入以缩短脚本启动时间
+    from rich.console import Console
+    console = Console()
     console.print("[blue]Generating comprehensive evaluation report...[/blue]")
     
     output_dir = Path('results/analysis')
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    report_content = []
-    
-    # 报告头部
-    report_content.append('# EVM Semantics Summarization Evaluation Report\n\n')
-    report_content.append(f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n\n')
-    report_content.append('This report summarizes the comprehensive evaluation of EVM semantics summarization.\n\n')
-    
-    # 步骤摘要
-    steps_info = [
-        ('Step 3', 'Summarization Evaluation', 'EVM opcode summarization coverage and effectiveness'),
-        ('Step 4', 'Prove Summaries Correctness', 'Verification of summarization semantic correctness'),
-        ('Step 5', 'Pure Concrete Performance', 'Baseline concrete execution performance'),
-        ('Step 6', 'Summary Concrete Performance', 'Summarized concrete execution performance'),
-        ('Step 7', 'Pure Symbolic Performance', 'Baseline symbolic execution performance'),
-        ('Step 8', 'Summary Symbolic Performance', 'Summarized symbolic execution performance')
-    ]
-    
-    report_content.append('## Evaluation Steps\n\n')
-    for step, name, desc in steps_info:
-        report_content.append(f'- **{step}: {name}**: {desc}\n')
-    
-    # 生成的文件清单
-    report_content.append('\n## Generated Artifacts\n\n')
-    
-    # 检查charts目录
-    charts_dir = output_dir / 'charts'
-    if charts_dir.exists():
-        report_content.append('### Charts\n')
-        chart_files = list(charts_dir.glob('*.pdf'))
-        if chart_files:
-            for chart_file in sorted(chart_files):
-                report_content.append(f'- [{chart_file.name}]({chart_file.relative_to(output_dir)})\n')
-        else:
-            report_content.append('- No chart files found\n')
-        report_content.append('\n')
-    
-    # 检查tables目录
-    tables_dir = output_dir / 'tables'
-    if tables_dir.exists():
-        report_content.append('### LaTeX Tables\n')
-        table_files = list(tables_dir.glob('*.tex'))
-        if table_files:
-            for table_file in sorted(table_files):
-                report_content.append(f'- [{table_file.name}]({table_file.relative_to(output_dir)})\n')
+    # 生成的文件清单：检查charts和tables目录
+    artifacts = io.StringIO()
+    for subdir, heading, suffix, label in (('charts', 'Charts', '.pdf', 'chart'),
+                                           ('tables', 'LaTeX Tables', '.tex', 'table')):
+        artifact_names = _list_artifacts(output_dir / subdir, suffix)
+        if artifact_names is None:
+            continue
+        artifacts.write(f'### {heading}\n')
+        if artifact_names:
+            for name in artifact_names:
+                artifacts.write(f'- [{name}]({subdir}/{name})\n')
         else:
-            report_content.append('- No table files found\n')
-        report_content.append('\n')
-    
-    # 数据统计
-    report_content.append('### Data Statistics\n\n')
-    
-    # 尝试读取一些关键数据文件并提供统计信息
-    data_files = [
-        'results/data/summarize_evaluation_results.json',
-        'results/data/prove_summaries_results.json',
-        'results/data/pure_concrete_performance.json',
-        'results/data/summary_concrete_performance.json'
-    ]
-    
-    for data_file in data_files:
-        if os.path.exists(data_file):
-            try:
-                with open(data_file, 'r') as f:
-                    data = json.load(f)
-                
-                file_name = Path(data_file).stem
-                report_content.append(f'#### {file_name}\n')
-                
-                # 基本统计
-                if 'test_results' in data:
-                    test_results = data['test_results']
-                    total_tests = len(test_results)
-                    passed_tests = sum(1 for test in test_results if test.get('status') == 'passed')
-                    success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-                    
-                    report_content.append(f'- Total tests: {total_tests}\n')
-                    report_content.append(f'- Passed tests: {passed_tests}\n')
-                    report_content.append(f'- Success rate: {success_rate:.1f}%\n')
-                
-                if 'statistics' in data:
-                    stats = data['statistics']
-                    if 'overall' in stats:
-                        overall = stats['overall']
-                        report_content.append(f'- Overall statistics: {overall}\n')
-                
-                report_content.append('\n')
-                
-            except Exception as e:
-                report_content.append(f'- Error reading {data_file}: {e}\n\n')
-    
-    # 关键发现
-    report_content.append('## Key Findings\n\n')
-    report_content.append('### Summarization Effectiveness\n')
-    report_content.append('- EVM opcode summarization coverage analysis\n')
-    report_content.append('- Semantic equivalence verification results\n\n')
-    
-    report_content.append('### Performance Improvements\n')
-    report_content.append('- Concrete execution performance gains\n')
-    report_content.append('- Symbolic execution efficiency improvements\n')
-    report_content.append('- Statistical significance of performance differences\n\n')
-    
-    report_content.append('### Correctness Verification\n')
-    report_content.append('- Summarization semantic correctness validation\n')
-    report_content.append('- Test case coverage and success rates\n\n')
-    
-    # 使用建议
-    report_content.append('## Usage for Academic Papers\n\n')
-    report_content.append('### Recommended Paper Structure\n')
-    report_content.append('```latex\n')
-    report_content.append('\\section{Evaluation}\n')
-    report_content.append('\\subsection{Experimental Setup}\n')
-    report_content.append('\\subsection{Summarization Effectiveness}\n')
-    report_content.append('\\input{results/analysis/tables/step3_summarization_evaluation.tex}\n')
-    report_content.append('\\subsection{Performance Analysis}\n')
-    report_content.append('\\includegraphics{results/analysis/charts/comprehensive_performance_comparison.pdf}\n')
-    report_content.append('\\input{results/analysis/tables/concrete_performance_comparison.tex}\n')
-    report_content.append('```\n\n')
+            artifacts.write(f'- No {label} files found\n')
+        artifacts.write('\n')
+    
+    # 数据统计：数据文件互不依赖，并行读取以重叠I/O
+    with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as executor:
+        loaded = list(executor.map(_try_read_data_stats, DATA_FILES))
+    
+    data_statistics = io.StringIO()
+    for data_file, result in zip(DATA_FILES, loaded):
+        if result is None:
+            continue
+        data_stats, error = result
+        if error is not None:
+            data_statistics.write(f'- Error reading {data_file}: {error}\n\n')
+            continue
+        
+        file_name = Path(data_file).stem
+        data_statistics.write(f'#### {file_name}\n')
+        
+        # 基本统计
+        if data_stats['total_tests'] is not None:
+            total_tests = data_stats['total_tests']
+            passed_tests = data_stats['passed_tests']
+            success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+            
+            data_statistics.write(f'- Total tests: {total_tests}\n')
+            data_statistics.write(f'- Passed tests: {passed_tests}\n')
+            data_statistics.write(f'- Success rate: {success_rate:.1f}%\n')
+        
+        if data_stats['overall'] is not None:
+            data_statistics.write(f'- Overall statistics: {data_stats["overall"]}\n')
+        
+        data_statistics.write('\n')
+    
+    report = REPORT_TEMPLATE.format_map({
+        'generated_on': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'steps': STEPS_SECTION,
+        'artifacts': artifacts.getvalue(),
+        'data_statistics': data_statistics.getvalue(),
+    })
     
     # 保存报告
     report_file = output_dir / 'evaluation_report.md'
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(report_content))
+        f.write(report)
     
     console.print(f'[green]✓ Comprehensive evaluation report generated: {report_file}[/green]')
 
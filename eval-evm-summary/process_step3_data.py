@@ -6,11 +6,26 @@ Output: results/processed/step3_processed.json (format directly usable by perfx)
 """
 
 import json
+import os
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Add opcode alias mapping
 opcode_aliases = {
     # Opcode alias mappings can be added here, currently empty
@@ -75,15 +90,72 @@ OPCODE_CATEGORIES = {
     }
 }
 
+# Category order and opcode to category mapping, built once at import time (read-only)
+CATEGORY_NAMES = tuple(OPCODE_CATEGORIES)
+OPCODE_TO_CATEGORY = MappingProxyType({
+    opcode: category_name
+    for category_name, category_data in OPCODE_CATEGORIES.items()
+    for opcode in category_data['opcodes']
+})
+
+@dataclass
+class CategoryStats:
+    """Accumulated statistics for one opcode category, in output field order"""
+    category: str
+    total_count: int = 0
+    successful_count: int = 0
+    failed_count: int = 0
+    success_rate: float = 0.0
+    avg_time: float = 0.0
+    avg_gas_steps: float = 0.0
+    avg_nogas_steps: float = 0.0
+    avg_gas_reduction: float = 0.0
+    avg_nogas_reduction: float = 0.0
+    avg_steps: float = 0.0
+    avg_reduction: float = 0.0
+    success_opcodes: str = ""
+    failed_opcodes: str = ""
+    # Verification-related fields
+    verification_total: int = 0
+    verification_passed: int = 0
+    verification_failed: int = 0
+    verification_success_rate: float = 0.0
+    avg_verification_time: float = 0.0
+    
+    def update_reductions(self):
+        """Derive the reduction percentages from the average step counts"""
+        self.avg_gas_reduction = _reduction_percent(self.avg_gas_steps)
+        self.avg_nogas_reduction = _reduction_percent(self.avg_nogas_steps)
+        self.avg_reduction = _reduction_percent(self.avg_steps)
+
+
+def _reduction_percent(avg_steps: float) -> float:
+    """Percentage of steps saved when a summary replaces avg_steps with a single step"""
+    if avg_steps > 0:
+        return ((avg_steps - 1) / avg_steps) * 100
+    return 0.0
+
+
 def load_json_file(file_path: str) -> Optional[Dict[str, Any]]:
     """Safely load JSON file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # json detects the UTF-8 encoding of bytes itself, so skip the text-mode decoder
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        return orjson.loads(content) if orjson is not None else json.loads(content)
     except Exception as e:
         print(f"Error: Failed to load {file_path}: {e}")
         return None
 
+def stream_results(file_path: str):
+    """Yield the opcode results of a summarization results file one at a time with ijson"""
+    with open(file_path, 'rb') as f:
+        # Results are either under a top-level "results" key or the document is the list itself
+        head = f.read(64).lstrip()
+        f.seek(0)
+        prefix = 'item' if head.startswith(b'[') else 'results.item'
+        yield from ijson.items(f, prefix, use_float=True)
+
 def _calculate_reduction(rewriting_steps: List[int]) -> float:
     """Calculate reduction value"""
     if not rewriting_steps or len(rewriting_steps) < 2:
@@ -99,18 +171,18 @@ def _calculate_reduction(rewriting_steps: List[int]) -> float:
     reduction = (initial_steps - final_steps) / initial_steps
     return max(0.0, min(1.0, reduction))  # Limit between 0-1
 
-def _expand_opcode_name(opcode_name: str) -> List[str]:
+# Opcode families reported as a single range representation
+OPCODE_EXPANSIONS = {
+    "DUP": ("DUP1-16",),
+    "SWAP": ("SWAP1-16",),
+    "PUSH": ("PUSH1-32",),
+    "LOG": ("LOG0-4",),
+}
+
+def _expand_opcode_name(opcode_name: str) -> Tuple[str, ...]:
     """Expand opcode names, e.g., DUP -> DUP1-16, SWAP -> SWAP1-16, PUSH -> PUSH1-32, LOG -> LOG0-4"""
-    if opcode_name == "DUP":
-        return ["DUP1-16"]  # Simplified as range representation
-    elif opcode_name == "SWAP":
-        return ["SWAP1-16"]  # Simplified as range representation
-    elif opcode_name == "PUSH":
-        return ["PUSH1-32"]  # Simplified as range representation
-    elif opcode_name == "LOG":
-        return ["LOG0-4"]  # Simplified as range representation
-    else:
-        return [opcode_name]  # Other opcodes are not expanded
+    # Other opcodes are not expanded
+    return OPCODE_EXPANSIONS.get(opcode_name, (opcode_name,))
 
 def parse_prove_summaries_data(prove_file: str) -> Dict[str, Dict[str, Any]]:
     """Parse prove_summaries_results.json file, extract opcode verification information"""
@@ -124,8 +196,9 @@ def parse_prove_summaries_data(prove_file: str) -> Dict[str, Dict[str, Any]]:
         # Extract opcode name from test_id
         # Format: "src/tests/integration/test_prove.py::test_prove_summaries[SAR-SUMMARY]"
         test_id = test.get('test_id', '')
-        if '-SUMMARY]' in test_id:
-            opcode = test_id.split('[')[1].split('-')[0]
+        params = test_id.partition('[')[2]
+        if params.endswith('-SUMMARY]'):
+            opcode = params.partition('-')[0]
             status = test.get('status', 'UNKNOWN')
             duration = test.get('duration', 0.0)
             
@@ -137,28 +210,31 @@ def parse_prove_summaries_data(prove_file: str) -> Dict[str, Dict[str, Any]]:
     
     return prove_results
 
-def process_step3_data(input_file: str, output_file: str, prove_file: str = None):
-    """Process step 3 data, generate perfx-compatible JSON format"""
+def process_step3_data(input_file: str, output_file: str, prove_file: str = None, stream: bool = False,
+                       compact: bool = False, quiet: bool = False):
+    """Process step 3 data, generate perfx-compatible JSON format
+    
+    With stream=True the opcode results are parsed incrementally with ijson instead of
+    loading the whole input file, which keeps memory bounded on large result sets.
+    """
+    
+    # Load prove_summaries data in a background thread while the original data is loaded
+    has_prove_file = bool(prove_file) and Path(prove_file).exists()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prove_future = executor.submit(parse_prove_summaries_data, prove_file) if has_prove_file else None
+        
+        # Load original data
+        data = load_json_file(input_file) if not stream else None
+        prove_results = prove_future.result() if prove_future is not None else {}
     
-    # Load original data
-    data = load_json_file(input_file)
-    if data is None:
+    if not stream and data is None:
         return False
     
-    # Load prove_summaries data
-    prove_results = {}
-    if prove_file and Path(prove_file).exists():
-        prove_results = parse_prove_summaries_data(prove_file)
+    if has_prove_file:
         print(f"📋 Loaded prove_summaries data for {len(prove_results)} opcodes")
     else:
         print(f"⚠️  Prove_summaries file not found or not specified: {prove_file}")
     
-    # Create opcode to category mapping
-    opcode_to_category = {}
-    for category_name, category_data in OPCODE_CATEGORIES.items():
-        for opcode in category_data['opcodes']:
-            opcode_to_category[opcode] = category_name
-    
     # Create perfx-compatible data structure
     processed_data = {
         "metadata": {
@@ -171,216 +247,187 @@ def process_step3_data(input_file: str, output_file: str, prove_file: str = None
         "categories": {}  # Category statistics
     }
     
-    # Initialize statistics for all categories
-    for category_name in OPCODE_CATEGORIES.keys():
-        processed_data["categories"][category_name] = {
-            "category": category_name,
-            "total_count": 0,
-            "successful_count": 0,
-            "failed_count": 0,
-            "success_rate": 0.0,
-            "avg_time": 0.0,
-            "avg_gas_steps": 0.0,
-            "avg_nogas_steps": 0.0,
-            "avg_gas_reduction": 0.0,
-            "avg_nogas_reduction": 0.0,
-            "avg_steps": 0.0,
-            "avg_reduction": 0.0,
-            "success_opcodes": "",
-            "failed_opcodes": "",
-            # New verification-related fields
-            "verification_total": 0,
-            "verification_passed": 0,
-            "verification_failed": 0,
-            "verification_success_rate": 0.0,
-            "avg_verification_time": 0.0
-        }
-    
-    # Add Total category for storing summary information
-    processed_data["categories"]["Total"] = {
-        "category": "Total",
-        "total_count": 0,
-        "successful_count": 0,
-        "failed_count": 0,
-        "success_rate": 0.0,
-        "avg_time": 0.0,
-        "avg_gas_steps": 0.0,
-        "avg_nogas_steps": 0.0,
-        "avg_gas_reduction": 0.0,
-        "avg_nogas_reduction": 0.0,
-        "avg_steps": 0.0,
-        "avg_reduction": 0.0,
-        "success_opcodes": "",
-        "failed_opcodes": "",
-                    # New verification-related fields
-        "verification_total": 0,
-        "verification_passed": 0,
-        "verification_failed": 0,
-        "verification_success_rate": 0.0,
-        "avg_verification_time": 0.0
-    }
+    # Initialize statistics for all categories plus Total for the summary information
+    for category_name in CATEGORY_NAMES:
+        processed_data["categories"][category_name] = CategoryStats(category_name)
+    processed_data["categories"]["Total"] = CategoryStats("Total")
     
     # Process original data
-    results_list = data.get('results', [])
-    if not results_list:
-        results_list = data if isinstance(data, list) else []
+    if stream:
+        results_list = stream_results(input_file)
+        print("📋 Streaming opcode results")
+    else:
+        results_list = data.get('results', [])
+        if not results_list:
+            results_list = data if isinstance(data, list) else []
+        
+        print(f"📋 Found {len(results_list)} opcode results")
+    
+    # Number of processed opcode results per category (not expanded), used for averages
+    processed_counts = Counter()
+    
+    # Total category accumulators - completely based on opcode calculation
+    total_opcodes = 0
+    total_successful = 0
+    total_failed = 0
+    total_time = 0.0
+    total_gas_steps = 0.0
+    total_nogas_steps = 0.0
+    total_steps = 0.0
+    successful_opcodes_count = 0  # Number of successfully processed opcodes (for calculating averages)
+    all_success_opcodes = []
+    all_failed_opcodes = []
+    
+    # Opcode names per category, joined into strings once after the loop
+    success_opcodes = {category_name: [] for category_name in CATEGORY_NAMES}
+    failed_opcodes = {category_name: [] for category_name in CATEGORY_NAMES}
     
-    print(f"📋 Found {len(results_list)} opcode results")
+    categories = processed_data["categories"]
     
+    # Single pass: update the opcode's category and the Total category together
     # Loop through each opcode from original data
-    for item in results_list:
-        if not isinstance(item, dict) or 'opcode' not in item:
-            continue
+    try:
+        for item in results_list:
+            if not isinstance(item, dict) or 'opcode' not in item:
+                continue
             
-        opcode = item['opcode']
-        
-        # Handle opcode aliases
-        if opcode in opcode_aliases:
-            opcode = opcode_aliases[opcode]
-        
-        # Check if opcode is in any category
-        if opcode not in opcode_to_category:
-            print(f"❌ Error: Opcode '{item['opcode']}' (mapped to '{opcode}') not found in any category!")
-            return False
+            raw_opcode = item['opcode']
         
-        category_name = opcode_to_category[opcode]
-        rewriting_steps = item.get('rewriting_steps') or []
+            # Handle opcode aliases
+            opcode = opcode_aliases.get(raw_opcode, raw_opcode)
         
-        # Process individual opcode result
-        status = 'success' if item.get('success', False) else 'failed'
-        time = item.get('time')
+            # Check if opcode is in any category
+            category_name = OPCODE_TO_CATEGORY.get(opcode)
+            if category_name is None:
+                print(f"❌ Error: Opcode '{raw_opcode}' (mapped to '{opcode}') not found in any category!")
+                return False
         
-        # Parse rewriting_steps: first is gas path, second is nogas path
-        gas_steps = None
-        nogas_steps = None
+            processed_counts[category_name] += 1
+            rewriting_steps = item.get('rewriting_steps') or []
         
-        if len(rewriting_steps) >= 2:
-            gas_steps = rewriting_steps[0]
-            nogas_steps = rewriting_steps[1]
-        elif len(rewriting_steps) == 1:
-            gas_steps = rewriting_steps[0]
-            nogas_steps = rewriting_steps[0]  # If there's only one value, both gas and nogas use this value
+            # Process individual opcode result
+            succeeded = item.get('success', False)
+            time = item.get('time')
         
-        # Expand opcode names (e.g., DUP -> DUP1-16)
-        expanded_opcodes = _expand_opcode_name(opcode)
-        actual_count = len(expanded_opcodes)
+            # Parse rewriting_steps: first is gas path, second is nogas path
+            # If there's only one value, both gas and nogas use this value
+            gas_steps = rewriting_steps[0] if rewriting_steps else None
+            nogas_steps = rewriting_steps[1] if len(rewriting_steps) > 1 else gas_steps
         
-        # Update category statistics
-        category_stats = processed_data["categories"][category_name]
-        category_stats["total_count"] += actual_count
+            # Expand opcode names (e.g., DUP -> DUP1-16)
+            expanded_opcodes = _expand_opcode_name(opcode)
+            actual_count = len(expanded_opcodes)
         
-        if status == 'success':
-            category_stats["successful_count"] += actual_count
-        else:
-            category_stats["failed_count"] += actual_count
+            # Update category and Total counts (Total is based on expanded opcode count)
+            category_stats = categories[category_name]
+            category_stats.total_count += actual_count
+            total_opcodes += actual_count
         
-        # Accumulate performance data
-        if time is not None:
-            category_stats["avg_time"] += float(time)
+            # Accumulate performance data (Total time is calculated based on expanded count)
+            if time is not None:
+                category_stats.avg_time += time
+                total_time += time * actual_count
         
-        # Accumulate gas and nogas steps (only calculate for successful opcodes)
-        if status == 'success':
-            if gas_steps is not None:
-                category_stats["avg_gas_steps"] += float(gas_steps)
-            if nogas_steps is not None:
-                category_stats["avg_nogas_steps"] += float(nogas_steps)
+            if succeeded:
+                category_stats.successful_count += actual_count
+                total_successful += actual_count
+                successful_opcodes_count += actual_count
             
-            # Accumulate total steps (average of gas and nogas)
-            if gas_steps is not None and nogas_steps is not None:
-                total_steps = (gas_steps + nogas_steps) / 2
-                category_stats["avg_steps"] += float(total_steps)
-            elif gas_steps is not None:
-                category_stats["avg_steps"] += float(gas_steps)
-            elif nogas_steps is not None:
-                category_stats["avg_steps"] += float(nogas_steps)
+                # Accumulate gas and nogas steps (only calculate for successful opcodes)
+                if gas_steps is not None:
+                    category_stats.avg_gas_steps += gas_steps
+                if nogas_steps is not None:
+                    category_stats.avg_nogas_steps += nogas_steps
             
-            # Add successful opcodes to string
-            if category_stats["success_opcodes"]:
-                category_stats["success_opcodes"] += ", " + ", ".join(expanded_opcodes)
-            else:
-                category_stats["success_opcodes"] = ", ".join(expanded_opcodes)
-        else:
-            # Add failed opcodes to string
-            if category_stats["failed_opcodes"]:
-                category_stats["failed_opcodes"] += ", " + ", ".join(expanded_opcodes)
+                # Accumulate total steps (average of gas and nogas)
+                if gas_steps is not None and nogas_steps is not None:
+                    category_stats.avg_steps += (gas_steps + nogas_steps) / 2
+                elif gas_steps is not None:
+                    category_stats.avg_steps += gas_steps
+                elif nogas_steps is not None:
+                    category_stats.avg_steps += nogas_steps
+            
+                # Add successful opcodes to list
+                success_opcodes[category_name].extend(expanded_opcodes)
+            
+                # Accumulate Total steps and opcode list; successful opcodes without
+                # rewriting steps count towards the average but are not listed
+                if rewriting_steps:
+                    total_gas_steps += gas_steps * actual_count
+                    total_nogas_steps += nogas_steps * actual_count
+                    total_steps += (gas_steps + nogas_steps) / 2 * actual_count
+                    all_success_opcodes.extend(expanded_opcodes)
             else:
-                category_stats["failed_opcodes"] = ", ".join(expanded_opcodes)
+                category_stats.failed_count += actual_count
+                total_failed += actual_count
+            
+                # Add failed opcodes to lists
+                failed_opcodes[category_name].extend(expanded_opcodes)
+                all_failed_opcodes.extend(expanded_opcodes)
+    except Exception as e:
+        # Streamed input is only read while iterating, so a missing, truncated or malformed file fails here
+        if not stream:
+            raise
+        print(f"Error: Failed to load {input_file}: {e}")
+        return False
+    
+    for category_name in CATEGORY_NAMES:
+        category_stats = categories[category_name]
+        category_stats.success_opcodes = ", ".join(success_opcodes[category_name])
+        category_stats.failed_opcodes = ", ".join(failed_opcodes[category_name])
     
     # Calculate averages and success rates for each category
     for category_name, category_stats in processed_data["categories"].items():
         if category_name == "Total":  # Skip Total category, calculate later
             continue
             
-        total_count = category_stats["total_count"]
+        total_count = category_stats.total_count
         if total_count > 0:
-            category_stats["success_rate"] = (category_stats["successful_count"] / total_count) * 100
+            category_stats.success_rate = (category_stats.successful_count / total_count) * 100
             
             # Calculate averages (based on actual processed opcode count)
-            processed_opcodes = 0
-            for item in results_list:
-                if not isinstance(item, dict) or 'opcode' not in item:
-                    continue
-                opcode = item['opcode']
-                if opcode in opcode_aliases:
-                    opcode = opcode_aliases[opcode]
-                if opcode in opcode_to_category and opcode_to_category[opcode] == category_name:
-                    processed_opcodes += 1
+            processed_opcodes = processed_counts[category_name]
             
             if processed_opcodes > 0:
-                category_stats["avg_time"] = category_stats["avg_time"] / processed_opcodes
+                category_stats.avg_time = category_stats.avg_time / processed_opcodes
                 
                 # Calculate average gas and nogas steps (based on actual processed opcode count, not expanded count)
                 if processed_opcodes > 0:
-                    category_stats["avg_gas_steps"] = category_stats["avg_gas_steps"] / processed_opcodes
-                    category_stats["avg_nogas_steps"] = category_stats["avg_nogas_steps"] / processed_opcodes
-                    category_stats["avg_steps"] = category_stats["avg_steps"] / processed_opcodes
+                    category_stats.avg_gas_steps = category_stats.avg_gas_steps / processed_opcodes
+                    category_stats.avg_nogas_steps = category_stats.avg_nogas_steps / processed_opcodes
+                    category_stats.avg_steps = category_stats.avg_steps / processed_opcodes
                     
                     # Calculate reduction
-                    if category_stats["avg_gas_steps"] > 0:
-                        category_stats["avg_gas_reduction"] = ((category_stats["avg_gas_steps"] - 1) / category_stats["avg_gas_steps"]) * 100
-                    if category_stats["avg_nogas_steps"] > 0:
-                        category_stats["avg_nogas_reduction"] = ((category_stats["avg_nogas_steps"] - 1) / category_stats["avg_nogas_steps"]) * 100
-                    if category_stats["avg_steps"] > 0:
-                        category_stats["avg_reduction"] = ((category_stats["avg_steps"] - 1) / category_stats["avg_steps"]) * 100
+                    category_stats.update_reductions()
     
     # Process verification data
     for opcode, prove_info in prove_results.items():
-        if opcode in opcode_to_category:
-            category_name = opcode_to_category[opcode]
+        if opcode in OPCODE_TO_CATEGORY:
+            category_name = OPCODE_TO_CATEGORY[opcode]
             category_stats = processed_data["categories"][category_name]
             
             # Update verification statistics
-            category_stats["verification_total"] += 1
+            category_stats.verification_total += 1
             if prove_info['success']:
-                category_stats["verification_passed"] += 1
+                category_stats.verification_passed += 1
             else:
-                category_stats["verification_failed"] += 1
+                category_stats.verification_failed += 1
             
             # Accumulate verification time
-            category_stats["avg_verification_time"] += prove_info['duration']
+            category_stats.avg_verification_time += prove_info['duration']
     
     # Calculate verification statistics
     for category_name, category_stats in processed_data["categories"].items():
         if category_name == "Total":  # Skip Total category, calculate later
             continue
             
-        verification_total = category_stats["verification_total"]
+        verification_total = category_stats.verification_total
         if verification_total > 0:
-            category_stats["verification_success_rate"] = (category_stats["verification_passed"] / verification_total) * 100
-            category_stats["avg_verification_time"] = category_stats["avg_verification_time"] / verification_total
+            category_stats.verification_success_rate = (category_stats.verification_passed / verification_total) * 100
+            category_stats.avg_verification_time = category_stats.avg_verification_time / verification_total
     
-    # Calculate Total category statistics - completely based on opcode calculation
+    # Calculate Total category statistics
     total_category = processed_data["categories"]["Total"]
-    total_opcodes = 0
-    total_successful = 0
-    total_failed = 0
-    total_time = 0.0
-    total_gas_steps = 0.0
-    total_nogas_steps = 0.0
-    total_steps = 0.0
-    successful_opcodes_count = 0  # Number of successfully processed opcodes (for calculating averages)
-    all_success_opcodes = []
-    all_failed_opcodes = []
     
     # Verification statistics
     total_verification = 0
@@ -388,102 +435,29 @@ def process_step3_data(input_file: str, output_file: str, prove_file: str = None
     total_verification_failed = 0
     total_verification_time = 0.0
     
-    # Calculate Total statistics completely based on opcode
-    for item in results_list:
-        if not isinstance(item, dict) or 'opcode' not in item:
-            continue
-            
-        opcode = item['opcode']
-        if opcode in opcode_aliases:
-            opcode = opcode_aliases[opcode]
-        
-        # Check if opcode is in any category
-        if opcode not in opcode_to_category:
-            continue
-        
-        status = 'success' if item.get('success', False) else 'failed'
-        time = item.get('time')
-        rewriting_steps = item.get('rewriting_steps') or []
-        
-        # Expand opcode names (e.g., DUP -> DUP1-16)
-        expanded_opcodes = _expand_opcode_name(opcode)
-        actual_count = len(expanded_opcodes)
-        
-        # Accumulate counts (based on expanded opcode count)
-        total_opcodes += actual_count
-        if status == 'success':
-            total_successful += actual_count
-        else:
-            total_failed += actual_count
-        
-        # Accumulate time (calculated based on expanded count)
-        if time is not None:
-            total_time += float(time) * actual_count  # Modified: time multiplied by expanded count
-        
-        # Accumulate steps (only successful opcodes, calculated based on expanded count)
-        if status == 'success':
-            successful_opcodes_count += actual_count  # Modified: successful count also based on expanded count
-            
-            if len(rewriting_steps) >= 2:
-                gas_steps = rewriting_steps[0]
-                nogas_steps = rewriting_steps[1]
-            elif len(rewriting_steps) == 1:
-                gas_steps = rewriting_steps[0]
-                nogas_steps = rewriting_steps[0]
-            else:
-                continue
-            
-            # Modified: steps also multiplied by expanded count
-            total_gas_steps += float(gas_steps) * actual_count
-            total_nogas_steps += float(nogas_steps) * actual_count
-            
-            if gas_steps is not None and nogas_steps is not None:
-                total_steps += (gas_steps + nogas_steps) / 2 * actual_count
-            elif gas_steps is not None:
-                total_steps += gas_steps * actual_count
-            elif nogas_steps is not None:
-                total_steps += nogas_steps * actual_count
-        
-        # Collect opcode lists
-        if status == 'success':
-            if all_success_opcodes:
-                all_success_opcodes.append(", ".join(expanded_opcodes))
-            else:
-                all_success_opcodes = [", ".join(expanded_opcodes)]
-        else:
-            if all_failed_opcodes:
-                all_failed_opcodes.append(", ".join(expanded_opcodes))
-            else:
-                all_failed_opcodes = [", ".join(expanded_opcodes)]
-    
     # Fill Total category statistics
-    total_category["total_count"] = total_opcodes
-    total_category["successful_count"] = total_successful
-    total_category["failed_count"] = total_failed
+    total_category.total_count = total_opcodes
+    total_category.successful_count = total_successful
+    total_category.failed_count = total_failed
     
     if total_opcodes > 0:
-        total_category["success_rate"] = (total_successful / total_opcodes) * 100
+        total_category.success_rate = (total_successful / total_opcodes) * 100
     
     if successful_opcodes_count > 0:
         # Modified: average calculation based on expanded count
-        total_category["avg_time"] = total_time / successful_opcodes_count
-        total_category["avg_gas_steps"] = total_gas_steps / successful_opcodes_count
-        total_category["avg_nogas_steps"] = total_nogas_steps / successful_opcodes_count
-        total_category["avg_steps"] = total_steps / successful_opcodes_count
+        total_category.avg_time = total_time / successful_opcodes_count
+        total_category.avg_gas_steps = total_gas_steps / successful_opcodes_count
+        total_category.avg_nogas_steps = total_nogas_steps / successful_opcodes_count
+        total_category.avg_steps = total_steps / successful_opcodes_count
         
         # Calculate reduction (logic remains unchanged)
-        if total_category["avg_gas_steps"] > 0:
-            total_category["avg_gas_reduction"] = ((total_category["avg_gas_steps"] - 1) / total_category["avg_gas_steps"]) * 100
-        if total_category["avg_nogas_steps"] > 0:
-            total_category["avg_nogas_reduction"] = ((total_category["avg_nogas_steps"] - 1) / total_category["avg_nogas_steps"]) * 100
-        if total_category["avg_steps"] > 0:
-            total_category["avg_reduction"] = ((total_category["avg_steps"] - 1) / total_category["avg_steps"]) * 100
+        total_category.update_reductions()
     
     # Merge all opcodes
     if all_success_opcodes:
-        total_category["success_opcodes"] = ", ".join(all_success_opcodes)
+        total_category.success_opcodes = ", ".join(all_success_opcodes)
     if all_failed_opcodes:
-        total_category["failed_opcodes"] = ", ".join(all_failed_opcodes)
+        total_category.failed_opcodes = ", ".join(all_failed_opcodes)
     
     # Process verification data
     for opcode, prove_info in prove_results.items():
@@ -495,38 +469,57 @@ def process_step3_data(input_file: str, output_file: str, prove_file: str = None
         total_verification_time += prove_info['duration']
     
     # Fill verification statistics
-    total_category["verification_total"] = total_verification
-    total_category["verification_passed"] = total_verification_passed
-    total_category["verification_failed"] = total_verification_failed
+    total_category.verification_total = total_verification
+    total_category.verification_passed = total_verification_passed
+    total_category.verification_failed = total_verification_failed
     
     if total_verification > 0:
-        total_category["verification_success_rate"] = (total_verification_passed / total_verification) * 100
-        total_category["avg_verification_time"] = total_verification_time / total_verification
+        total_category.verification_success_rate = (total_verification_passed / total_verification) * 100
+        total_category.avg_verification_time = total_verification_time / total_verification
     
     # Save processed data
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    processed_data["categories"] = {
+        category_name: asdict(category_stats)
+        for category_name, category_stats in processed_data["categories"].items()
+    }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"✅ Step 3 data processed successfully!")
-    print(f"   📄 Output: {output_file}")
-    print(f"   📊 Categories: {len(OPCODE_CATEGORIES)}")
-    print(f"   🔢 Total opcodes: {total_category['total_count']}")
-    print(f"   ✅ Success rate: {total_category['success_rate']:.1f}%")
-    print(f"   📈 Overall statistics:")
-    print(f"      ⏱️  Avg time: {total_category['avg_time']:.2f}s")
-    print(f"      🔢 Avg gas steps: {total_category['avg_gas_steps']:.2f}")
-    print(f"      🔢 Avg nogas steps: {total_category['avg_nogas_steps']:.2f}")
-    print(f"      🔢 Avg steps: {total_category['avg_steps']:.2f}")
-    print(f"      📉 Avg gas reduction: {total_category['avg_gas_reduction']:.1f}%")
-    print(f"      📉 Avg nogas reduction: {total_category['avg_nogas_reduction']:.1f}%")
-    print(f"      📉 Avg reduction: {total_category['avg_reduction']:.1f}%")
-    print(f"   🔍 Verification statistics:")
-    print(f"      📊 Total verified: {total_category['verification_total']}")
-    print(f"      ✅ Verification success rate: {total_category['verification_success_rate']:.1f}%")
-    print(f"      ⏱️  Avg verification time: {total_category['avg_verification_time']:.2f}s")
+    if orjson is not None:
+        content = orjson.dumps(processed_data, option=0 if compact else orjson.OPT_INDENT_2)
+    elif compact:
+        content = json.dumps(processed_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    else:
+        content = json.dumps(processed_data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Write to a sibling temp file and rename it over the output, so an interrupted
+    # run never leaves a truncated file behind for perfx
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, output_path)
+    
+    if quiet:
+        print(f"✅ Step 3 data processed successfully: {output_file}")
+    else:
+        print(
+            f"✅ Step 3 data processed successfully!\n"
+            f"   📄 Output: {output_file}\n"
+            f"   📊 Categories: {len(CATEGORY_NAMES)}\n"
+            f"   🔢 Total opcodes: {total_category.total_count}\n"
+            f"   ✅ Success rate: {total_category.success_rate:.1f}%\n"
+            f"   📈 Overall statistics:\n"
+            f"      ⏱️  Avg time: {total_category.avg_time:.2f}s\n"
+            f"      🔢 Avg gas steps: {total_category.avg_gas_steps:.2f}\n"
+            f"      🔢 Avg nogas steps: {total_category.avg_nogas_steps:.2f}\n"
+            f"      🔢 Avg steps: {total_category.avg_steps:.2f}\n"
+            f"      📉 Avg gas reduction: {total_category.avg_gas_reduction:.1f}%\n"
+            f"      📉 Avg nogas reduction: {total_category.avg_nogas_reduction:.1f}%\n"
+            f"      📉 Avg reduction: {total_category.avg_reduction:.1f}%\n"
+            f"   🔍 Verification statistics:\n"
+            f"      📊 Total verified: {total_category.verification_total}\n"
+            f"      ✅ Verification success rate: {total_category.verification_success_rate:.1f}%\n"
+            f"      ⏱️  Avg verification time: {total_category.avg_verification_time:.2f}s"
+        )
     
     return True
 
@@ -538,9 +531,18 @@ def main():
                        help="Output file path")
     parser.add_argument("--prove", default="results/data/prove_summaries_results.json",
                        help="prove_summaries_results.json file path")
+    parser.add_argument("--stream", action="store_true",
+                       help="Parse the input incrementally with ijson to bound memory on large inputs")
+    parser.add_argument("--compact", action="store_true",
+                       help="Write the output without indentation")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Skip the statistics summary after processing")
     
     args = parser.parse_args()
     
+    if args.stream and ijson is None:
+        parser.error("--stream requires the ijson package")
+    
     print("🔄 Starting to process Step 3 data...")
     
     if not Path(args.input).exists():
@@ -548,7 +550,8 @@ def main():
         sys.exit(1)
     
     # Process main data
-    success = process_step3_data(args.input, args.output, args.prove)
+    success = process_step3_data(args.input, args.output, args.prove, stream=args.stream,
+                                 compact=args.compact, quiet=args.quiet)
     
     if success:
         print("🎉 Step 3 data processing completed!")
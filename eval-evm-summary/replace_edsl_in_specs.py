@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Spec Module Replacer - Rewrites the EDSL module name in KEVM spec files
+Used by the symbolic performance steps to switch specs between EDSL-PURE and EDSL-SUMMARY
+"""
+
+import argparse
+import mmap
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+EDSL_MODULE = b'EDSL'
+# Files up to this size are checked with a plain read before mapping them
+PREFIX_SCAN_SIZE = 65536
+
+
+def _walk_files(root: str):
+    """Yield (path, size) for every regular file under root without building Path objects"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry.stat(follow_symlinks=False).st_size
+
+
+def _backup_file(file_path: Path, backup_path: Path):
+    """Keep the original of a file before its first rewrite"""
+    if backup_path.exists():
+        return
+    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(file_path, backup_path)
+
+
+def _replace_in_file(file_path: str, size: int, target: bytes, backup_path: Path) -> bool:
+    """Replace EDSL occurrences in a single file, return True if the file was modified"""
+    if size < len(EDSL_MODULE):
+        return False
+
+    # Most spec files never mention EDSL, reject them without opening them for writing:
+    # small files with one read, larger ones through a read-only mapping
+    with open(file_path, 'rb') as f:
+        if size <= PREFIX_SCAN_SIZE:
+            if EDSL_MODULE not in f.read(PREFIX_SCAN_SIZE):
+                return False
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(EDSL_MODULE) == -1:
+                    return False
+
+    with open(file_path, 'r+b') as f:
+        fd = f.fileno()
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_WRITE) as mm:
+            idx = mm.find(EDSL_MODULE)
+            if idx == -1:
+                return False
+
+            _backup_file(file_path, backup_path)
+
+            # Same-length target can be substituted in place through the mapping
+            if len(target) == len(EDSL_MODULE):
+                while idx != -1:
+                    mm[idx:idx + len(EDSL_MODULE)] = target
+                    idx = mm.find(EDSL_MODULE, idx + len(target))
+                mm.flush()
+                return True
+
+            # Otherwise rebuild only the tail starting at the first occurrence
+            first = idx
+            tail = bytearray()
+            pos = idx
+            while idx != -1:
+                tail += mm[pos:idx]
+                tail += target
+                pos = idx + len(EDSL_MODULE)
+                idx = mm.find(EDSL_MODULE, pos)
+            tail += mm[pos:]
+
+        os.ftruncate(fd, first + len(tail))
+        os.pwrite(fd, tail, first)
+    return True
+
+
+def replace_edsl_in_specs(specs_dir: str, target_module: str, backup_dir: str) -> bool:
+    """Replace the EDSL module name with target_module in every file under specs_dir"""
+    specs_path = Path(specs_dir)
+    if not specs_path.is_dir():
+        print(f"❌ Specs directory does not exist: {specs_dir}")
+        return False
+
+    target = target_module.encode('utf-8')
+    backup_root = Path(backup_dir)
+    files = list(_walk_files(specs_dir))
+
+    def _process_one(file_info):
+        file_path, size = file_info
+        try:
+            backup_path = backup_root / os.path.relpath(file_path, specs_dir)
+            return _replace_in_file(file_path, size, target, backup_path), None
+        except Exception as e:
+            return False, f"{file_path}: {e}"
+
+    # File rewrites are independent and I/O-bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(_process_one, files))
+
+    errors = [error for _, error in results if error]
+    if errors:
+        for error in errors:
+            print(f"❌ Failed to rewrite {error}")
+        return False
+
+    modified = sum(1 for changed, _ in results if changed)
+    print(f"✅ Replaced EDSL with {target_module} in {modified} files")
+    return True
+
+
+def restore_specs(specs_dir: str, backup_dir: str) -> bool:
+    """Move the backed-up originals back over the rewritten spec files"""
+    specs_path = Path(specs_dir)
+    backup_root = Path(backup_dir)
+
+    if not backup_root.is_dir():
+        # No backups from a previous rewrite, fall back to git
+        print(f"⚠️  Backup directory not found: {backup_dir}, restoring specs with git")
+        # Revert tracked files, then drop untracked files left behind by the rewrite
+        for git_command in (["git", "checkout", "--", "."], ["git", "clean", "-fd", "--", "."]):
+            result = subprocess.run(git_command, cwd=specs_path)
+            if result.returncode != 0:
+                print(f"❌ {' '.join(git_command)} failed with exit code {result.returncode}")
+                return False
+        return True
+
+    restored = 0
+    for backup_path in backup_root.rglob("*"):
+        if backup_path.is_file():
+            # shutil.move falls back to copying when the backups live on another filesystem
+            shutil.move(str(backup_path), str(specs_path / backup_path.relative_to(backup_root)))
+            restored += 1
+    shutil.rmtree(backup_root)
+
+    print(f"✅ Restored {restored} spec files")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replace EDSL module name in KEVM spec files")
+    parser.add_argument("--specs-dir", default="repositories/evm-semantics/tests/specs",
+                       help="Specs directory path")
+    parser.add_argument("--target",
+                       help="Replacement module name, e.g. EDSL-PURE or EDSL-SUMMARY")
+    parser.add_argument("--backup-dir", default="results/backups/specs",
+                       help="Directory holding the originals of rewritten files")
+    parser.add_argument("--restore", action="store_true",
+                       help="Restore the original spec files from the backup directory")
+
+    args = parser.parse_args()
+
+    if args.restore:
+        success = restore_specs(args.specs_dir, args.backup_dir)
+    elif args.target:
+        success = replace_edsl_in_specs(args.specs_dir, args.target, args.backup_dir)
+    else:
+        parser.error("either --target or --restore is required")
+
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
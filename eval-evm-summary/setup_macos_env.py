@@ -10,42 +10,92 @@ import subprocess
 from pathlib import Path
 
 
+# Host platform, queried once
+SYSTEM = platform.system()
+MACHINE = platform.machine()
+
+# Homebrew keg directories to probe
+LLVM_OPT_DIRS = ("/opt/homebrew/opt", "/usr/local/opt")
+
+# Cellar directories of the llvm@14 formula
+LLVM_CELLAR_DIRS = ("/opt/homebrew/Cellar/llvm@14", "/usr/local/Cellar/llvm@14")
+
+# Prefer llvm@14, which is a verified version
+LLVM_CANDIDATES = [
+    ("/opt/homebrew/opt", "llvm@14"),  # Apple Silicon priority
+    ("/usr/local/opt", "llvm@14"),     # Intel Mac
+    ("/opt/homebrew/opt", "llvm@15"),
+    ("/opt/homebrew/opt", "llvm@16"),
+    ("/opt/homebrew/opt", "llvm@17"),
+    ("/usr/local/opt", "llvm@15"),
+    ("/usr/local/opt", "llvm@16"),
+    ("/usr/local/opt", "llvm@17"),
+]
+
+# (CC, CXX) found by the first probe, or () if none was found
+_llvm_compilers = None
+
+
+def _installed_llvm_kegs(opt_dir):
+    """Names of the llvm@* kegs in a Homebrew opt directory, listed with a single scandir"""
+    try:
+        with os.scandir(opt_dir) as it:
+            return {entry.name for entry in it if entry.name.startswith("llvm@")}
+    except OSError:
+        return set()
+
+
+def _llvm_version(keg):
+    """Major version of an llvm@N keg name, unparsable names sort last"""
+    version = keg.partition("@")[2]
+    return int(version) if version.isdigit() else float("inf")
+
+
+def find_llvm_compilers():
+    """Return (clang, clang++) of the preferred Homebrew LLVM, or () if none is installed"""
+    global _llvm_compilers
+    if _llvm_compilers is None:
+        installed = {opt_dir: _installed_llvm_kegs(opt_dir) for opt_dir in LLVM_OPT_DIRS}
+        # Kegs outside the preferred list (e.g. newer releases) are tried last, oldest first
+        others = sorted(
+            ((opt_dir, keg) for opt_dir, kegs in installed.items() for keg in kegs
+             if (opt_dir, keg) not in LLVM_CANDIDATES),
+            key=lambda candidate: _llvm_version(candidate[1]),
+        )
+        _llvm_compilers = ()
+        for opt_dir, keg in LLVM_CANDIDATES + others:
+            if keg not in installed[opt_dir]:
+                continue
+            clang_path = os.path.join(opt_dir, keg, "bin", "clang")
+            clangpp_path = os.path.join(opt_dir, keg, "bin", "clang++")
+            if os.path.isfile(clang_path) and os.path.isfile(clangpp_path):
+                _llvm_compilers = (clang_path, clangpp_path)
+                break
+    return _llvm_compilers
+
+
 def setup_compiler_for_macos():
     """Set appropriate compiler environment variables for macOS system"""
-    if platform.system() != "Darwin":
+    if SYSTEM != "Darwin":
         print("Non-macOS system, skipping compiler setup")
         return
     
-    print(f"Detected platform: {platform.system()} {platform.machine()}")
+    print(f"Detected platform: {SYSTEM} {MACHINE}")
     
-    # Prefer llvm@14, which is a verified version
-    llvm_paths = [
-        "/opt/homebrew/opt/llvm@14",  # Apple Silicon priority
-        "/usr/local/opt/llvm@14",     # Intel Mac
-        "/opt/homebrew/opt/llvm@15", 
-        "/opt/homebrew/opt/llvm@16",
-        "/opt/homebrew/opt/llvm@17",
-        "/usr/local/opt/llvm@15",
-        "/usr/local/opt/llvm@16",
-        "/usr/local/opt/llvm@17",
-    ]
-    
-    for llvm_path in llvm_paths:
-        clang_path = os.path.join(llvm_path, "bin", "clang")
-        clangpp_path = os.path.join(llvm_path, "bin", "clang++")
-        
-        if os.path.exists(clang_path) and os.path.exists(clangpp_path):
-            os.environ["CC"] = clang_path
-            os.environ["CXX"] = clangpp_path
-            print(f"✓ Set compiler: CC={clang_path}, CXX={clangpp_path}")
-            return
+    compilers = find_llvm_compilers()
+    if compilers:
+        clang_path, clangpp_path = compilers
+        os.environ["CC"] = clang_path
+        os.environ["CXX"] = clangpp_path
+        print(f"✓ Set compiler: CC={clang_path}, CXX={clangpp_path}")
+        return
     
     print("⚠️  Warning: Homebrew-installed LLVM compiler not found, will use system default compiler")
 
 
 def setup_apple_silicon_env():
     """Set Apple Silicon special environment variables"""
-    if platform.machine() == "arm64" and platform.system() == "Darwin":
+    if MACHINE == "arm64" and SYSTEM == "Darwin":
         os.environ["APPLE_SILICON"] = "true"
         print("✓ Set Apple Silicon environment variable: APPLE_SILICON=true")
     else:
@@ -54,9 +104,18 @@ def setup_apple_silicon_env():
 
 def check_homebrew_llvm():
     """Check if Homebrew LLVM is installed"""
+    # Looking for the keg in the Cellar avoids starting brew (and Ruby);
+    # set PERFX_USE_BREW_LIST=1 to ask brew itself instead
+    if os.environ.get("PERFX_USE_BREW_LIST") != "1":
+        if any(os.path.isdir(cellar_dir) for cellar_dir in LLVM_CELLAR_DIRS):
+            print("✓ Detected Homebrew LLVM@14")
+            return True
+        print("⚠️  Homebrew LLVM@14 not detected")
+        return False
+    
     try:
         result = subprocess.run(["brew", "list", "llvm@14"], 
-                              capture_output=True, text=True, check=False)
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         if result.returncode == 0:
             print("✓ Detected Homebrew LLVM@14")
             return True
@@ -4,13 +4,26 @@ Independent summarization evaluation script
 Used to be called in perfx configuration, implementing the same functionality as eval/evaluate_summarize.py
 """
 
+import argparse
+import atexit
 import sys
 import os
 import json
+import multiprocessing
+import signal
+import threading
 import time
 import traceback
-from typing import List, Dict, Any
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add kevm-pyk to Python path
 kevm_pyk_path = os.path.join(os.path.dirname(__file__), '..', 'repositories', 'evm-semantics', 'kevm-pyk')
@@ -31,6 +44,23 @@ except ImportError as e:
 
 SUMMARIZE_TIME_OUT = 10 * 60  # 10 minutes
 
+# Worker errors are returned as a truncated message unless full tracebacks are requested
+MAX_ERROR_CHARS = 512
+FULL_TRACEBACK = os.environ.get("PERFX_WORKER_FULL_TRACEBACK") == "1"
+
+# pyk KCFG class, imported in each worker process by _init_worker
+KCFG = None
+
+# Worker pool reused across evaluate_summarize_effectiveness calls so workers keep their imports
+_pool = None
+_pool_config = None
+_pool_lock = threading.Lock()
+# Set once a worker of the shared pool died, so the next call starts a fresh pool
+_pool_broken = False
+# Workers put their PID here on start, so stragglers can be terminated after a batch timeout
+_pool_pid_queue = None
+_pool_pids = set()
+
 # Opcode categories for evaluation
 OPCODE_CATEGORIES = {
     # 1. Arithmetic and Bitwise Operations
@@ -66,14 +96,41 @@ OPCODE_CATEGORIES = {
     'HASHING': ['SHA3'],  # Also known as KECCAK256
 }
 
+# Opcode to category mapping, built once at import time
+OPCODE_TO_CATEGORY = {opcode: cat for cat, op_list in OPCODE_CATEGORIES.items() for opcode in op_list}
+
+# Opcodes that have a summary status in kevm-pyk
+_HAS_SUMMARY_STATUS = frozenset(OPCODES_SUMMARY_STATUS)
+
+@lru_cache(maxsize=None)
+def _summary_status(opcode: str):
+    """Summary status of an opcode, or None if kevm-pyk has none; looked up once per process"""
+    return get_summary_status(opcode) if opcode in _HAS_SUMMARY_STATUS else None
+
 def get_opcode_category(opcode: str) -> str:
     """Get the category of an opcode"""
-    for cat, op_list in OPCODE_CATEGORIES.items():
-        if opcode in op_list:
-            return cat
-    return "UNKNOWN"
+    return OPCODE_TO_CATEGORY.get(opcode, "UNKNOWN")
+
+def _init_worker(pid_queue=None):
+    """Import the KCFG classes once per worker process instead of once per opcode"""
+    global KCFG
+    if pid_queue is not None:
+        pid_queue.put(os.getpid())
+    from pyk.kcfg import KCFG as _KCFG
+    KCFG = _KCFG
 
-def summarize_worker(opcode: str) -> Dict[str, Any]:
+def _raise_summarize_timeout(signum, frame):
+    raise TimeoutError("summarize did not finish within the worker timeout")
+
+def _set_worker_alarm(seconds: int) -> bool:
+    """Arm SIGALRM so a hung summarize() raises inside the worker, return False where unsupported"""
+    if not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        return False
+    signal.signal(signal.SIGALRM, _raise_summarize_timeout)
+    signal.alarm(seconds)
+    return True
+
+def summarize_worker(opcode: str, timeout_sec: int = SUMMARIZE_TIME_OUT) -> Dict[str, Any]:
     """Individual opcode summarization evaluation worker function"""
     start = time.time()
     entry = {
@@ -83,24 +140,28 @@ def summarize_worker(opcode: str) -> Dict[str, Any]:
         "time": None,
         "rewriting_steps": None,  # list of edge.depth
         "error": None,
-        "summary_status": get_summary_status(opcode) if opcode in OPCODES_SUMMARY_STATUS else None
+        "summary_status": _summary_status(opcode)
     }
     
+    # The parent cannot interrupt a running worker, so the worker enforces its own timeout
+    alarm_set = _set_worker_alarm(timeout_sec)
     try:
-        from pyk.kcfg import KCFG
+        if KCFG is None:
+            _init_worker()
         _, proofs = summarize(opcode)
         proof_success = True
         steps_list = []
         for proof in proofs:
+            kcfg = proof.kcfg
+            is_pending, is_bounded, is_terminal = proof.is_pending, proof.is_bounded, proof.is_terminal
+            is_stuck, is_vacuous, is_covered = kcfg.is_stuck, kcfg.is_vacuous, kcfg.is_covered
             # 1. All leaves not pending/stuck/vacuous/bounded
-            for leaf in proof.kcfg.leaves:
-                if proof.is_pending(leaf.id) or proof.kcfg.is_stuck(leaf.id) or proof.kcfg.is_vacuous(leaf.id) or proof.is_bounded(leaf.id):
-                    proof_success = False
-                    break
-            if not proof_success:
+            if any(is_pending(leaf.id) or is_stuck(leaf.id) or is_vacuous(leaf.id) or is_bounded(leaf.id)
+                   for leaf in kcfg.leaves):
+                proof_success = False
                 break
             # 2. Only one successor from init
-            successors = proof.kcfg.successors(proof.init)
+            successors = kcfg.successors(proof.init)
             if len(successors) != 1:
                 proof_success = False
                 break
@@ -108,43 +169,159 @@ def summarize_worker(opcode: str) -> Dict[str, Any]:
             # 3. Edge/terminal/covered check
             if isinstance(successor, KCFG.Split):
                 targets = successor.targets
-                if len(proof.kcfg.edges()) != len(targets):
+                if len(kcfg.edges()) != len(targets):
+                    proof_success = False
+                    break
+                # Every target needs exactly one outgoing edge that ends terminal or covered
+                target_successors = [kcfg.successors(target.id) for target in targets]
+                if not all(len(s2) == 1 and isinstance(s2[0], KCFG.Edge) for s2 in target_successors):
+                    proof_success = False
+                    break
+                edges = [s2[0] for s2 in target_successors]
+                if not all(is_terminal(edge.target.id) or is_covered(edge.target.id) for edge in edges):
                     proof_success = False
                     break
-                for target in targets:
-                    s2 = proof.kcfg.successors(target.id)
-                    if len(s2) != 1:
-                        proof_success = False
-                        break
-                    edge = s2[0]
-                    if not isinstance(edge, KCFG.Edge):
-                        proof_success = False
-                        break
-                    if not (proof.is_terminal(edge.target.id) or proof.kcfg.is_covered(edge.target.id)):
-                        proof_success = False
-                        break
-                    steps_list.append(edge.depth)
+                steps_list.extend(edge.depth for edge in edges)
             else:
-                if len(proof.kcfg.edges()) != 1:
+                if len(kcfg.edges()) != 1:
                     proof_success = False
                     break
                 if not isinstance(successor, KCFG.Edge):
                     proof_success = False
                     break
-                if not (proof.is_terminal(successor.target.id) or proof.kcfg.is_covered(successor.target.id)):
+                if not (is_terminal(successor.target.id) or is_covered(successor.target.id)):
                     proof_success = False
                     break
                 steps_list.append(successor.depth)
         entry["success"] = proof_success
         entry["rewriting_steps"] = steps_list
     except Exception as e:
-        entry["error"] = str(e) + "\n" + traceback.format_exc()
+        # Only a short message travels back to the parent, the traceback goes to the worker's stderr
+        if FULL_TRACEBACK:
+            entry["error"] = str(e) + "\n" + traceback.format_exc()
+        else:
+            entry["error"] = f"{type(e).__name__}: {str(e)[:MAX_ERROR_CHARS]}"
+            print(f"Error summarizing {opcode}:\n{traceback.format_exc()}", file=sys.stderr)
     finally:
+        if alarm_set:
+            signal.alarm(0)
         entry["time"] = time.time() - start
     
     return entry
 
-def evaluate_summarize_effectiveness(timeout_sec: int = 600, max_workers: int = 4, skip_opcodes: List[str] = None) -> List[Dict[str, Any]]:
+def _failed_result(opcode: str, error: str) -> Dict[str, Any]:
+    """Result entry for an opcode that produced no summarization result"""
+    return {
+        "opcode": opcode,
+        "category": get_opcode_category(opcode),
+        "success": False,
+        "time": None,
+        "rewriting_steps": None,
+        "error": error,
+        "summary_status": _summary_status(opcode)
+    }
+
+def _collect_result(future, opcode: str) -> Dict[str, Any]:
+    """Result of a finished worker future, or a failed entry if the worker raised"""
+    global _pool_broken
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        _pool_broken = True
+        return _failed_result(opcode, f"timeout or error: {str(e)}")
+    except Exception as e:
+        return _failed_result(opcode, f"timeout or error: {str(e)}")
+
+def _get_pool(max_workers: int, start_method: Optional[str] = None) -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use or when its configuration changes"""
+    global _pool, _pool_config, _pool_broken, _pool_pid_queue
+    config = (max_workers, start_method)
+    with _pool_lock:
+        if _pool is not None and (_pool_config != config or _pool_broken):
+            _pool.shutdown()
+            _pool = None
+            _pool_pids.clear()
+        if _pool is None:
+            mp_context = multiprocessing.get_context(start_method)
+            if start_method == "forkserver":
+                # Workers forked from the server then start with kevm-pyk already imported
+                mp_context.set_forkserver_preload(["kevm_pyk.summarizer", "pyk.kcfg"])
+            _pool_pid_queue = mp_context.SimpleQueue()
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                        initializer=_init_worker, initargs=(_pool_pid_queue,))
+            _pool_config = config
+            _pool_broken = False
+        return _pool
+
+def _discard_pool(terminate: bool = False):
+    """Shut down the shared worker pool, terminating workers still running an opcode if requested"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            return
+        if terminate:
+            # ProcessPoolExecutor cannot cancel running calls, so the workers are terminated by PID
+            while not _pool_pid_queue.empty():
+                _pool_pids.add(_pool_pid_queue.get())
+            for pid in _pool_pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        _pool.shutdown(wait=not terminate)
+        _pool = None
+        _pool_pids.clear()
+
+atexit.register(_discard_pool)
+
+def load_cost_hints(results_file: str) -> Dict[str, float]:
+    """Per-opcode run times from a previous results file, empty if it is missing or unreadable"""
+    try:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    results = previous.get("results") if isinstance(previous, dict) else None
+    if not isinstance(results, list):
+        return {}
+    hints = {}
+    for r in results:
+        if not isinstance(r, dict) or not isinstance(r.get("opcode"), str):
+            continue
+        if isinstance(r.get("time"), (int, float)):
+            hints[r["opcode"]] = r["time"]
+        elif isinstance(r.get("error"), str) and "timeout" in r["error"]:
+            # Opcodes cut off by a timeout took at least as long as anything that finished
+            hints[r["opcode"]] = float("inf")
+    return hints
+
+def load_journal(journal_path: str):
+    """Run configuration and results already recorded in a journal from an interrupted run, keyed by opcode"""
+    header = None
+    recorded = {}
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # The last line may have been cut off by the crash
+                    continue
+                if not isinstance(result, dict):
+                    continue
+                if "journal" in result:
+                    header = result["journal"]
+                elif "opcode" in result:
+                    recorded[result["opcode"]] = result
+    except OSError:
+        pass
+    return header, recorded
+
+def evaluate_summarize_effectiveness(timeout_sec: int = 600, max_workers: int = 4, skip_opcodes: List[str] = None,
+                                     journal_path: Optional[str] = None,
+                                     start_method: Optional[str] = None,
+                                     cost_hints: Optional[Dict[str, float]] = None,
+                                     resume: bool = False) -> List[Dict[str, Any]]:
     """
     Evaluate the summarization effectiveness of all opcodes
     
@@ -152,6 +329,11 @@ def evaluate_summarize_effectiveness(timeout_sec: int = 600, max_workers: int =
         timeout_sec: Timeout for each opcode evaluation (seconds)
         max_workers: Maximum number of parallel worker processes
         skip_opcodes: List of opcodes to skip
+        journal_path: Optional JSON Lines file that receives each result as soon as it is available
+        start_method: multiprocessing start method for the workers, None for the platform default
+        cost_hints: Optional expected run time per opcode, slowest opcodes are submitted first
+        resume: Keep the successful results of an interrupted run from journal_path if it was written with
+            the same timeout and skipped opcodes; failed and timed-out opcodes are evaluated again
     
     Returns:
         List of dictionaries containing evaluation results for each opcode
@@ -167,41 +349,79 @@ def evaluate_summarize_effectiveness(timeout_sec: int = 600, max_workers: int =
     print(f"Evaluating {len(opcodes_to_evaluate)} opcodes out of {len(OPCODES)} total")
     
     results = []
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        future_to_opcode = {executor.submit(summarize_worker, opcode): opcode for opcode in opcodes_to_evaluate.keys()}
-        for future in as_completed(future_to_opcode):
-            opcode = future_to_opcode[future]
-            try:
-                result = future.result(timeout=timeout_sec)
-            except Exception as e:
-                result = {
-                    "opcode": opcode,
-                    "category": get_opcode_category(opcode),
-                    "success": False,
-                    "time": None,
-                    "rewriting_steps": None,
-                    "error": f"timeout or error: {str(e)}",
-                    "summary_status": get_summary_status(opcode) if opcode in OPCODES_SUMMARY_STATUS else None
-                }
-            results.append(result)
+    # Configuration recorded as the first journal line, results are only resumed under the same one
+    run_config = {"timeout_seconds": timeout_sec, "skipped_opcodes": sorted(skip_opcodes)}
+    resumed = False
+    if journal_path and resume:
+        header, recorded = load_journal(journal_path)
+        if header == run_config:
+            resumed = True
+            for opcode, result in recorded.items():
+                if opcode in opcodes_to_evaluate and result.get("success"):
+                    results.append(result)
+                    del opcodes_to_evaluate[opcode]
+            print(f"Resuming from {journal_path}: {len(results)} opcodes already evaluated")
+        elif header is not None:
+            print(f"Warning: {journal_path} was written with a different configuration, not resuming")
     
-            # Add skipped opcodes to results
-    for opcode in skip_opcodes:
-        results.append({
-            "opcode": opcode,
-            "category": get_opcode_category(opcode),
-            "success": False,
-            "time": None,
-            "rewriting_steps": None,
-            "error": "SKIPPED",
-            "summary_status": get_summary_status(opcode) if opcode in OPCODES_SUMMARY_STATUS else None
-        })
+    # Longest expected opcodes first, so no long run is left starting on an otherwise idle pool
+    submission_order = list(opcodes_to_evaluate)
+    if cost_hints:
+        submission_order.sort(key=lambda opcode: -cost_hints.get(opcode, 0))
+    
+    journal = None
+    if resumed:
+        with open(journal_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            partial_line = f.read(1) != b"\n"
+        journal = open(journal_path, 'a', encoding='utf-8')
+        if partial_line:
+            # Start on a fresh line after the entry the interrupted run left cut off
+            journal.write("\n")
+    elif journal_path:
+        journal = open(journal_path, 'w', encoding='utf-8')
+        journal.write(json.dumps({"journal": run_config}) + "\n")
+        journal.flush()
+    
+    def record(result: Dict[str, Any]):
+        """Keep a result and append it to the journal so finished opcodes survive a crash"""
+        results.append(result)
+        if journal is not None:
+            journal.write(json.dumps(result, ensure_ascii=False) + "\n")
+            journal.flush()
+    
+    try:
+        executor = _get_pool(max_workers, start_method)
+        future_to_opcode = {executor.submit(summarize_worker, opcode, timeout_sec): opcode for opcode in submission_order}
+        pending = set(future_to_opcode)
+        # Each opcode gets timeout_sec with max_workers running at once, which bounds the whole batch
+        deadline = timeout_sec * -(-len(future_to_opcode) // max_workers)
+        try:
+            for future in as_completed(future_to_opcode, timeout=deadline):
+                pending.discard(future)
+                record(_collect_result(future, future_to_opcode[future]))
+        except FuturesTimeoutError:
+            # Stragglers still hold worker processes, cancel what has not started and stop the rest
+            for future, opcode in future_to_opcode.items():
+                if future not in pending:
+                    continue
+                if future.cancel() or not future.done():
+                    record(_failed_result(opcode, f"timeout: not finished within {deadline} seconds"))
+                else:
+                    record(_collect_result(future, opcode))
+            _discard_pool(terminate=True)
+    
+        # Add skipped opcodes to results
+        for opcode in skip_opcodes:
+            record(_failed_result(opcode, "SKIPPED"))
+    finally:
+        if journal is not None:
+            journal.close()
     
     return results
 
 def main():
     """Main function"""
-    import argparse
     
     parser = argparse.ArgumentParser(description="EVM Opcode Summarization Evaluator")
     parser.add_argument("--timeout", type=int, default=1800, help="Timeout for each opcode (seconds)")
@@ -212,6 +432,13 @@ def main():
         'JUMP', 'JUMPI', 'MUL', 'SELFDESTRUCT', 'STATICCALL', 'EXP', 'SAR', 'SHA3'
     ], help="List of opcodes to skip")
     parser.add_argument("--output", default="results/data/summarize_evaluation_results.json", help="Output file path")
+    parser.add_argument("--start-method", choices=multiprocessing.get_all_start_methods(), default=None,
+                        help="Worker start method (default: platform default)")
+    parser.add_argument("--cost-hints", default=None,
+                        help="Previous results file whose per-opcode times order the submission, slowest first")
+    parser.add_argument("--resume", action="store_true",
+                        help="Keep the successful results journaled by an interrupted run with the same "
+                             "timeout and skipped opcodes; the KEVM build is assumed unchanged")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -222,17 +449,30 @@ def main():
     print(f"Number of worker processes: {args.workers}")
     print(f"Skipped opcodes: {', '.join(args.skip_opcodes)}")
     
+    # Results are journaled next to the output while the evaluation runs
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    journal_path = args.output + ".jsonl"
+    
     # Execute evaluation
     results = evaluate_summarize_effectiveness(
         timeout_sec=args.timeout,
         max_workers=args.workers,
-        skip_opcodes=args.skip_opcodes
+        skip_opcodes=args.skip_opcodes,
+        journal_path=journal_path,
+        start_method=args.start_method,
+        cost_hints=load_cost_hints(args.cost_hints) if args.cost_hints else None,
+        resume=args.resume
     )
     
-    # Count results
-    successful = sum(1 for r in results if r["success"])
-    failed = sum(1 for r in results if not r["success"] and r["error"] != "SKIPPED")
-    skipped = sum(1 for r in results if r["error"] == "SKIPPED")
+    # Count results in a single pass
+    status_counts = Counter()
+    category_counts = Counter()
+    for r in results:
+        status_counts["successful" if r["success"] else "skipped" if r["error"] == "SKIPPED" else "failed"] += 1
+        category_counts[r["category"]] += 1
+    successful = status_counts["successful"]
+    failed = status_counts["failed"]
+    skipped = status_counts["skipped"]
     
     if args.verbose:
             print(f"\nEvaluation completed:")
@@ -242,23 +482,31 @@ def main():
     print(f"  Total: {len(results)}")
     
     # Save results
-    os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump({
-            "metadata": {
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "timeout_seconds": args.timeout,
-                "max_workers": args.workers,
-                "skipped_opcodes": args.skip_opcodes
-            },
-            "summary": {
-                "total": len(results),
-                "successful": successful,
-                "failed": failed,
-                "skipped": skipped
-            },
-            "results": results
-        }, f, indent=2, ensure_ascii=False)
+    document = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timeout_seconds": args.timeout,
+            "max_workers": args.workers,
+            "skipped_opcodes": args.skip_opcodes
+        },
+        "summary": {
+            "total": len(results),
+            "successful": successful,
+            "failed": failed,
+            "skipped": skipped,
+            "by_category": dict(category_counts)
+        },
+        "results": results
+    }
+    if orjson is not None:
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+    
+    # The complete results file supersedes the journal
+    os.remove(journal_path)
     
     if args.verbose:
         print(f"Results saved to: {args.output}")
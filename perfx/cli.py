@@ -125,7 +125,8 @@ def info(config_file: str):
 @click.option("--steps", "-s", help="Comma-separated list of steps to run")
 @click.option("--output-dir", "-o", help="Output directory")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def run(config_file: str, steps: Optional[str], output_dir: Optional[str], verbose: bool):
+@click.option("--clear-cache", is_flag=True, help="Clear the dependency cache so cached steps run again")
+def run(config_file: str, steps: Optional[str], output_dir: Optional[str], verbose: bool, clear_cache: bool):
     """Run an evaluation using a configuration file"""
     try:
         config_manager = ConfigManager()
@@ -141,6 +142,9 @@ def run(config_file: str, steps: Optional[str], output_dir: Optional[str], verbo
         # Create executor
         executor = EvaluationExecutor(config, output_dir or config["global"].get("output_directory", "results"))
         
+        if clear_cache:
+            executor.dependency_manager.clear_cache()
+        
         # Determine steps to run
         if steps:
             step_list = [s.strip() for s in steps.split(",")]
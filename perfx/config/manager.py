@@ -4,6 +4,7 @@ Configuration manager for Perfx
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -182,8 +183,6 @@ class ConfigManager:
         if isinstance(data, str):
             # Replace ${VAR} with environment variable value
             if "${" in data and "}" in data:
-                import re
-
                 pattern = r"\$\{([^}]+)\}"
 
                 def replace_var(match):
@@ -6,7 +6,6 @@ Dependency manager for detecting file and folder changes
 import os
 import hashlib
 import json
-import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass, asdict
@@ -158,15 +157,18 @@ class DependencyManager:
                 # New dependency, consider it changed
                 has_changes = True
             elif current_info:
-                # Compare with cached info
-                if (current_info.last_modified != cached_info.last_modified or
-                    current_info.hash != cached_info.hash):
+                # Compare with cached info. A directory's own mtime also moves when scratch files
+                # are created and removed in it, so directories compare by their content hash only
+                if current_info.hash != cached_info.hash:
+                    has_changes = True
+                elif (current_info.type == "file" and
+                      current_info.last_modified != cached_info.last_modified):
                     has_changes = True
         
-        # Update cache only if there are changes
+        # Keep the new state in memory only; mark_step_completed persists it once the step succeeded,
+        # so a step that fails or never finishes is not skipped on the next run
         if has_changes:
             self.dependency_cache[step_name] = current_deps
-            self._save_cache()
         
         return has_changes
     
@@ -174,16 +176,16 @@ class DependencyManager:
         """Mark a step as completed (useful for manual cache management)"""
         if step_name in self.dependency_cache:
             # Recalculate current dependency info to mark as up-to-date
-            current_time = time.time()
             for dep_path, dep_info in self.dependency_cache[step_name].items():
-                # Recalculate hash and update timestamp
+                # Recalculate hash and record the on-disk timestamp, so an unchanged
+                # dependency compares equal on the next check
                 path_obj = Path(dep_path)
                 if path_obj.exists():
                     if dep_info.type == "file":
                         dep_info.hash = self._get_file_hash(path_obj)
                     elif dep_info.type == "directory":
                         dep_info.hash = self._get_directory_hash(path_obj, dep_info.pattern)
-                dep_info.last_modified = current_time
+                    dep_info.last_modified = path_obj.stat().st_mtime
             self._save_cache()
     
     def clear_cache(self, step_name: Optional[str] = None):
@@ -305,6 +305,9 @@ class EvaluationExecutor:
                 # For steps without file dependencies, mark them as completed in cache
                 self.dependency_manager.dependency_cache[step_name] = {}
                 self.dependency_manager._save_cache()
+        elif dependencies and not step_skipped:
+            # Drop the dependency state recorded before the step ran, so the failed step runs again
+            self.dependency_manager.clear_cache(step_name)
 
         return final_success
 
@@ -342,6 +345,8 @@ class EvaluationExecutor:
         command_env = command_config.get("environment", {})
         env.update(command_env)
 
+        cwd_str = str(cwd)
+
         console.print(f"[dim]Executing: {command}[/dim]")
         if cwd != self.working_dir:
             console.print(f"[dim]Working directory: {cwd}[/dim]")
@@ -375,7 +380,7 @@ class EvaluationExecutor:
             console.print(f"[red]Command timed out after {timeout} seconds[/red]")
             self.recorder.add_command(
                 command=command,
-                cwd=str(cwd),
+                cwd=cwd_str,
                 env_vars=env,
                 success=False,
                 duration=timeout,
@@ -387,7 +392,7 @@ class EvaluationExecutor:
             console.print(f"[red]Error running command: {e}[/red]")
             self.recorder.add_command(
                 command=command,
-                cwd=str(cwd),
+                cwd=cwd_str,
                 env_vars=env,
                 success=False,
                 duration=time.time() - start_time,
@@ -401,7 +406,7 @@ class EvaluationExecutor:
         # Record command execution
         self.recorder.add_command(
             command=command,
-            cwd=str(cwd),
+            cwd=cwd_str,
             env_vars=env,
             output=result.stdout,
             error=result.stderr,
@@ -437,25 +442,18 @@ class EvaluationExecutor:
                     if output_path.startswith('results/'):
                         output_path = output_path[8:]  # Remove 'results/' prefix
                     
-                    output_file_path = Path(self.output_dir) / output_path
+                    output_file_path = self.output_dir / output_path
                     output_file_path.parent.mkdir(parents=True, exist_ok=True)
                     
                     # Apply parser if specified
                     if parser_type:
                         try:
-                            from perfx.parsers import ParserFactory
-                            factory = ParserFactory()
-                            
                             parser_config = {"type": parser_type}
-                            parser = factory.create_parser(parser_config)
+                            parser = self.parser_factory.create_parser(parser_config)
                             
-                            # Parse the content
-                            if input_type == "stdout":
-                                parsed_result = parser.parse(result.stdout, result.stderr, result.returncode)
-                            elif input_type == "stderr":
-                                parsed_result = parser.parse("", result.stderr, result.returncode)
-                            else:  # combined
-                                parsed_result = parser.parse(result.stdout, result.stderr, result.returncode)
+                            # Parse the content (stdout and combined inputs both parse stdout)
+                            parsed_stdout = "" if input_type == "stderr" else result.stdout
+                            parsed_result = parser.parse(parsed_stdout, result.stderr, result.returncode)
                             
                             # Save parsed result as JSON
                             with open(output_file_path, 'w', encoding='utf-8') as f:
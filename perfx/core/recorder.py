@@ -9,6 +9,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Characters kept from each end of a recorded command output
+MAX_RECORDED_OUTPUT = 65536
+
+
+def _truncate(text: Optional[str], limit: int = MAX_RECORDED_OUTPUT) -> Optional[str]:
+    """Keep the head and tail of a long command output"""
+    if text is None or len(text) <= 2 * limit:
+        return text
+    elided = len(text) - 2 * limit
+    return f"{text[:limit]}\n...[{elided} characters elided]...\n{text[-limit:]}"
+
 
 class EvaluationRecorder:
     """Recorder for storing evaluation results and command history"""
@@ -32,13 +43,14 @@ class EvaluationRecorder:
         duration: float = None,
     ) -> None:
         """Record executed command"""
+        # Outputs are kept for the whole run, so cap them to bound memory
         command_record = {
             "timestamp": datetime.now().isoformat(),
             "command": command,
             "cwd": cwd,
             "env_vars": env_vars,
-            "output": output,
-            "error": error,
+            "output": _truncate(output),
+            "error": _truncate(error),
             "success": success,
             "duration": duration,
         }
@@ -7,7 +7,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from rich.console import Console
 
 console = Console()
@@ -73,6 +73,8 @@ class VisualizationConfigProcessor:
         self.data_dir = self.base_dir / config.get('data_directory', 'results/processed')
         self.output_dir = self.base_dir / config.get('output_directory', 'results/analysis')
         self.console = Console()
+        # 对比图表的输入数据缓存，key为(输入文件, 数据与过滤配置)
+        self._comparison_data_cache: Dict[Tuple[Tuple[str, ...], str], List[Dict[str, float]]] = {}
     
     def process_tables(self) -> Dict[str, Any]:
         """处理表格配置"""
@@ -272,76 +274,90 @@ class VisualizationConfigProcessor:
             self.console.print(f"[red]Error generating chart: {e}[/red]")
             return False
     
+    def _load_comparison_data(self, input_files: List[Path], data_config: Dict[str, Any],
+                              filters: Dict[str, Any]) -> Optional[List[Dict[str, float]]]:
+        """加载并过滤对比图表的输入数据；同一组文件和配置只加载一次，供多个图表复用"""
+        cache_key = (tuple(str(f) for f in input_files), json.dumps([data_config, filters], sort_keys=True))
+        if cache_key in self._comparison_data_cache:
+            return self._comparison_data_cache[cache_key]
+        
+        # 加载所有输入文件的数据
+        datasets = []
+        for input_file in input_files:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            datasets.append(data)
+        
+        # 数据提取配置
+        test_results_path = data_config.get('test_results_path', 'test_results')
+        test_id_field = data_config.get('test_id_field', 'test_id')
+        duration_field = data_config.get('duration_field', 'duration')
+        status_field = data_config.get('status_field', 'status')
+        error_field = data_config.get('error_field', 'error_message')
+        
+        # 过滤配置
+        include_statuses = frozenset(filters.get('include_statuses', ['PASSED', 'FAILED']) or ())
+        exclude_statuses = frozenset(filters.get('exclude_statuses', ['SKIPPED']) or ())
+        only_successful = filters.get('only_successful', False)
+        ignore_errors = filters.get('ignore_errors', False)
+        
+        # 从每个数据集中提取测试结果
+        test_data_sets = []
+        for i, data in enumerate(datasets):
+            test_results = self._extract_data_by_path(data, test_results_path)
+            if not test_results:
+                self.console.print(f"[yellow]Warning: No data found at path '{test_results_path}' in file {input_files[i]}[/yellow]")
+                return None
+            
+            # 提取并过滤测试数据；测试结果由解析器生成，几乎总是dict，因此用EAFP代替逐条isinstance检查
+            test_data = {}
+            for test in test_results:
+                try:
+                    test_id = test.get(test_id_field)
+                    duration = test.get(duration_field)
+                    status = test.get(status_field)
+                    error_msg = test.get(error_field)
+                except AttributeError:
+                    continue
+                
+                # 基本验证
+                if not test_id or duration is None:
+                    continue
+                
+                # 状态过滤
+                if include_statuses and status not in include_statuses:
+                    continue
+                if exclude_statuses and status in exclude_statuses:
+                    continue
+                
+                # 成功状态过滤
+                if only_successful and status != 'PASSED':
+                    continue
+                
+                # 错误过滤
+                if ignore_errors and error_msg:
+                    continue
+                
+                test_data[test_id] = float(duration)
+            
+            test_data_sets.append(test_data)
+        
+        self._comparison_data_cache[cache_key] = test_data_sets
+        return test_data_sets
+    
     def _generate_comparison_chart(self, chart_config: Dict[str, Any], input_files: List[Path], output_file: Path) -> bool:
         """生成对比图表（处理多个输入文件）"""
         try:
             from perfx.visualizers.academic_charts import AcademicChartGenerator
             
-            # 加载所有输入文件的数据
-            datasets = []
-            for input_file in input_files:
-                with open(input_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                datasets.append(data)
-            
             # 获取配置
             data_config = chart_config.get('data_config', {})
             filters = chart_config.get('filters', {})
             chart_config_options = chart_config.get('chart_config', {})
             
-            # 数据提取配置
-            test_results_path = data_config.get('test_results_path', 'test_results')
-            test_id_field = data_config.get('test_id_field', 'test_id')
-            duration_field = data_config.get('duration_field', 'duration')
-            status_field = data_config.get('status_field', 'status')
-            error_field = data_config.get('error_field', 'error_message')
-            
-            # 过滤配置
-            include_statuses = filters.get('include_statuses', ['PASSED', 'FAILED'])
-            exclude_statuses = filters.get('exclude_statuses', ['SKIPPED'])
-            only_successful = filters.get('only_successful', False)
-            ignore_errors = filters.get('ignore_errors', False)
-            
-            # 从每个数据集中提取测试结果
-            test_data_sets = []
-            for i, data in enumerate(datasets):
-                test_results = self._extract_data_by_path(data, test_results_path)
-                if not test_results:
-                    self.console.print(f"[yellow]Warning: No data found at path '{test_results_path}' in file {input_files[i]}[/yellow]")
-                    return False
-                
-                # 提取并过滤测试数据
-                test_data = {}
-                for test in test_results:
-                    if not isinstance(test, dict):
-                        continue
-                    
-                    test_id = test.get(test_id_field)
-                    duration = test.get(duration_field)
-                    status = test.get(status_field)
-                    error_msg = test.get(error_field)
-                    
-                    # 基本验证
-                    if not test_id or duration is None:
-                        continue
-                    
-                    # 状态过滤
-                    if include_statuses and status not in include_statuses:
-                        continue
-                    if exclude_statuses and status in exclude_statuses:
-                        continue
-                    
-                    # 成功状态过滤
-                    if only_successful and status != 'PASSED':
-                        continue
-                    
-                    # 错误过滤
-                    if ignore_errors and error_msg:
-                        continue
-                    
-                    test_data[test_id] = float(duration)
-                
-                test_data_sets.append(test_data)
+            test_data_sets = self._load_comparison_data(input_files, data_config, filters)
+            if test_data_sets is None:
+                return False
             
             if len(test_data_sets) != 2:
                 self.console.print("[yellow]Warning: Comparison chart requires exactly 2 input files[/yellow]")
@@ -3,6 +3,7 @@
 Base parser classes for Perfx
 """
 
+import json
 import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
@@ -83,8 +84,6 @@ class PytestParser(BaseParser):
 
     def parse(self, stdout: str, stderr: str, exit_code: int) -> Dict[str, Any]:
         """Parse pytest output with duration information"""
-        import re
-
         lines = stdout.split("\n")
 
         # Extract test results
@@ -264,8 +263,6 @@ class JsonParser(BaseParser):
 
     def parse(self, stdout: str, stderr: str, exit_code: int) -> Dict[str, Any]:
         """Parse JSON output"""
-        import json
-
         try:
             data = json.loads(stdout)
             return {
@@ -5,10 +5,22 @@ Parses pytest output to extract test durations and results
 """
 import re
 import json
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from perfx.parsers.base import BaseParser
 
+# Result line with worker info and progress, e.g.
+# [gw6] [  1%] PASSED src/tests/integration/test_prove.py::test_prove_summaries[SAR-SUMMARY]
+_MODERN_RESULT_RE = re.compile(r'\[(gw\d+)\]\s+\[\s*(\d+)%\]\s+(PASSED|FAILED|SKIPPED|ERROR)\s+(.+)')
+# Simple result line, e.g. test_example.py::test_function1 PASSED    [ 25%]
+_SIMPLE_RESULT_RE = re.compile(r'(.+?)\s+(PASSED|FAILED|SKIPPED|ERROR|passed|failed|skipped|error)\s+\[.*?\]')
+# Entry of the "slowest durations" section, e.g. 1239.98s call     src/tests/integration/test_prove.py::...
+_DURATION_RE = re.compile(r'(\d+\.?\d*)s\s+call\s+(.+)')
+_LINE_DURATION_RE = re.compile(r'(\d+\.?\d*)s')
+# Summary line, e.g. ================== 6 failed, 64 passed in 5681.63s (1:34:41) ==================
+_SUMMARY_RE = re.compile(r'=+\s+(\d+)\s+failed[,\s]+(\d+)\s+passed[,\s]+in\s+(\d+\.?\d*)s?\s+\(([^)]+)\)\s+=+')
+
 
 @dataclass
 class TestResult:
@@ -74,11 +86,22 @@ class PytestParser(BaseParser):
         self.test_results = []
         self.summary_stats = {}
         
+        # Split once and share the lines between all passes
+        lines = stdout.split('\n')
+        
         # Parse test results from stdout
-        self._parse_test_results(stdout)
+        self._parse_test_results(lines)
+        
+        # Aggregate statuses and durations in one pass; the summary fallback reuses them
+        status_counts = Counter()
+        total_duration = 0
+        for r in self.test_results:
+            status_counts[r.status] += 1
+            if r.duration:
+                total_duration += r.duration
         
         # Parse summary statistics
-        self._parse_summary_stats(stdout)
+        self._parse_summary_stats(lines, status_counts, total_duration)
         
         # Determine overall success
         success = exit_code == 0
@@ -89,33 +112,46 @@ class PytestParser(BaseParser):
             "test_results": [self._test_result_to_dict(result) for result in self.test_results],
             "summary_stats": self.summary_stats,
             "total_tests": len(self.test_results),
-            "passed_tests": len([r for r in self.test_results if r.status == "PASSED"]),
-            "failed_tests": len([r for r in self.test_results if r.status == "FAILED"]),
-            "skipped_tests": len([r for r in self.test_results if r.status == "SKIPPED"]),
-            "error_tests": len([r for r in self.test_results if r.status == "ERROR"]),
-            "total_duration": sum(r.duration or 0 for r in self.test_results),
+            "passed_tests": status_counts["PASSED"],
+            "failed_tests": status_counts["FAILED"],
+            "skipped_tests": status_counts["SKIPPED"],
+            "error_tests": status_counts["ERROR"],
+            "total_duration": total_duration,
             "raw_stdout": stdout,
             "raw_stderr": stderr
         }
     
-    def _parse_test_results(self, stdout: str):
+    def _parse_test_results(self, lines: List[str]):
         """Parse individual test results from pytest output"""
-        lines = stdout.split('\n')
-        
-        # First, parse the "slowest durations" section to get actual test durations
-        duration_map = self._parse_slowest_durations(stdout)
+        # The "slowest durations" section is collected in the same pass over the lines;
+        # since it comes after the result lines, durations are attached once the walk ends
+        duration_map = {}
+        in_slowest_section = False
+        slowest_section_done = False
+        line_durations = []
         
         for i, line in enumerate(lines):
             line = line.strip()
             if not line:
                 continue
+            
+            # Check if we're entering the slowest durations section
+            if not slowest_section_done:
+                if "slowest durations" in line:
+                    in_slowest_section = True
+                elif in_slowest_section:
+                    # Check if we're leaving the section (usually ends with ===)
+                    if line.startswith('==='):
+                        in_slowest_section = False
+                        slowest_section_done = True
+                    else:
+                        self._parse_duration_line(line, duration_map)
                 
             # Pattern 1: Modern pytest output with worker info and progress
             # Examples:
             # [gw6] [  1%] PASSED src/tests/integration/test_prove.py::test_prove_summaries[SAR-SUMMARY] 
             # [gw2] [ 42%] FAILED src/tests/integration/test_prove.py::test_prove_summaries[RETURN-SUMMARY] 
-            test_pattern_modern = r'\[(gw\d+)\]\s+\[\s*(\d+)%\]\s+(PASSED|FAILED|SKIPPED|ERROR)\s+(.+)'
-            match = re.search(test_pattern_modern, line)
+            match = _MODERN_RESULT_RE.search(line)
             
             if match:
                 worker_id = match.group(1)
@@ -129,8 +165,7 @@ class PytestParser(BaseParser):
                 # test_example.py::test_function4 FAILED                           [100%]
                 # test_example.py::test_function1 passed                           [ 50%]
                 # test_example.py::test_function4 failed                           [100%]
-                test_pattern_simple = r'(.+?)\s+(PASSED|FAILED|SKIPPED|ERROR|passed|failed|skipped|error)\s+\[.*?\]'
-                match = re.search(test_pattern_simple, line)
+                match = _SIMPLE_RESULT_RE.search(line)
                 
                 if match:
                     test_path = match.group(1).strip()
@@ -140,89 +175,53 @@ class PytestParser(BaseParser):
                 else:
                     continue
             
-            # Extract test name and parameter from path
+            # Use the full test path as test_id, including the file path and function name
             # src/tests/integration/test_prove.py::test_prove_summaries[SAR-SUMMARY]
             # test_example.py::test_function1
-            test_parts = test_path.split('::')
-            if len(test_parts) >= 2:
-                test_name = test_parts[1]  # test_prove_summaries[SAR-SUMMARY] or test_function1
-                
-                # Use the full test path as test_id instead of just the parameter
-                # This includes the file path and function name
-                test_id = test_path
-            else:
-                test_id = test_path
+            test_id = test_path
             
-            # Look for duration information
-            duration = None
-            error_message = None
-            
-            # First, check if we have duration from the "slowest durations" section
-            if test_id in duration_map:
-                duration = duration_map[test_id]
-            else:
-                # Check if there's duration info in the same line
-                duration_match = re.search(r'(\d+\.?\d*)s', line)
-                if duration_match:
-                    duration = float(duration_match.group(1))
+            # Remember the duration shown on the same line as a fallback
+            duration_match = _LINE_DURATION_RE.search(line)
+            line_durations.append(float(duration_match.group(1)) if duration_match else None)
             
             # For failed tests, look for error messages in "short test summary info" section
+            error_message = None
             if status in ["FAILED", "ERROR"]:
                 error_message = self._extract_error_message(lines, i, test_id)
             
             test_result = TestResult(
                 test_id=test_id,
                 status=status,
-                duration=duration,
                 error_message=error_message,
                 progress_percent=progress_percent,
                 worker_id=worker_id
             )
             self.test_results.append(test_result)
-    
-    def _parse_slowest_durations(self, stdout: str) -> Dict[str, float]:
-        """Parse the 'slowest durations' section from pytest output"""
-        duration_map = {}
         
-        # Look for the "slowest durations" section
-        lines = stdout.split('\n')
-        in_slowest_section = False
+        # Prefer durations from the "slowest durations" section
+        for test_result, line_duration in zip(self.test_results, line_durations):
+            test_result.duration = duration_map.get(test_result.test_id, line_duration)
+    
+    def _parse_duration_line(self, line: str, duration_map: Dict[str, float]):
+        """Parse a single line of the 'slowest durations' section into duration_map"""
+        # Pattern: "1239.98s call     repositories/evm-semantics/kevm-pyk/src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
+        # Multiple spaces between "call" and the test path are allowed
+        match = _DURATION_RE.search(line)
         
-        for line in lines:
-            line = line.strip()
-            
-            # Check if we're entering the slowest durations section
-            if "slowest durations" in line:
-                in_slowest_section = True
-                continue
+        if match:
+            duration = float(match.group(1))
+            full_test_path = match.group(2).strip()
             
-            # Check if we're leaving the section (usually ends with ===)
-            if in_slowest_section and line.startswith('==='):
-                break
+            # Extract the relative path from the full path
+            # From: "repositories/evm-semantics/kevm-pyk/src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
+            # To: "src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
+            if 'src/tests/' in full_test_path:
+                relative_path = full_test_path.split('src/tests/')[1]
+                test_path = f"src/tests/{relative_path}"
+            else:
+                test_path = full_test_path
             
-            # Parse duration lines in the slowest durations section
-            if in_slowest_section and line:
-                # Pattern: "1239.98s call     repositories/evm-semantics/kevm-pyk/src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
-                # Updated pattern to handle multiple spaces between "call" and the test path
-                duration_pattern = r'(\d+\.?\d*)s\s+call\s+(.+)'
-                match = re.search(duration_pattern, line)
-                
-                if match:
-                    duration = float(match.group(1))
-                    full_test_path = match.group(2).strip()
-                    
-                    # Extract the relative path from the full path
-                    # From: "repositories/evm-semantics/kevm-pyk/src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
-                    # To: "src/tests/integration/test_prove.py::test_prove_summaries[SLOAD-SUMMARY]"
-                    if 'src/tests/' in full_test_path:
-                        relative_path = full_test_path.split('src/tests/')[1]
-                        test_path = f"src/tests/{relative_path}"
-                    else:
-                        test_path = full_test_path
-                    
-                    duration_map[test_path] = duration
-        
-        return duration_map
+            duration_map[test_path] = duration
     
     def _extract_error_message(self, lines: List[str], line_index: int, test_id: str) -> Optional[str]:
         """Extract error message from "short test summary info" section"""
@@ -252,15 +251,13 @@ class PytestParser(BaseParser):
         
         return None
     
-    def _parse_summary_stats(self, stdout: str):
+    def _parse_summary_stats(self, lines: List[str], status_counts: Counter, total_duration: float):
         """Parse summary statistics from pytest output"""
         # Look for summary lines like:
         # ================== 6 failed, 64 passed in 5681.63s (1:34:41) ==================
-        summary_pattern = r'=+\s+(\d+)\s+failed[,\s]+(\d+)\s+passed[,\s]+in\s+(\d+\.?\d*)s?\s+\(([^)]+)\)\s+=+'
-        
-        lines = stdout.split('\n')
-        for line in lines:
-            match = re.search(summary_pattern, line)
+        # pytest prints it at the very end, so scan from the tail and stop at the first hit
+        for line in reversed(lines):
+            match = _SUMMARY_RE.search(line)
             if match:
                 failed_count = int(match.group(1))
                 passed_count = int(match.group(2))
@@ -279,10 +276,10 @@ class PytestParser(BaseParser):
         # If no summary found, calculate from test results
         if not self.summary_stats:
             self.summary_stats = {
-                "passed": len([r for r in self.test_results if r.status == "PASSED"]),
-                "failed": len([r for r in self.test_results if r.status == "FAILED"]),
-                "skipped": len([r for r in self.test_results if r.status == "SKIPPED"]),
-                "total_duration": sum(r.duration or 0 for r in self.test_results)
+                "passed": status_counts["PASSED"],
+                "failed": status_counts["FAILED"],
+                "skipped": status_counts["SKIPPED"],
+                "total_duration": total_duration
             }
     
     def _test_result_to_dict(self, result: TestResult) -> Dict[str, Any]:
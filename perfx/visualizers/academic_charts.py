@@ -4,6 +4,7 @@ Academic-grade chart generator for performance evaluation
 用于生成适合学术论文的高质量图表
 """
 
+import heapq
 import json
 import numpy as np
 import matplotlib.pyplot as plt
@@ -88,12 +89,13 @@ class AcademicChartGenerator:
         
         # 准备数据
         test_names = list(common_tests)
-        pure_times = [pure_data[test] for test in test_names]
-        summary_times = [summary_data[test] for test in test_names]
+        pure_times = np.fromiter((pure_data[test] for test in test_names), dtype=np.float64, count=len(test_names))
+        summary_times = np.fromiter((summary_data[test] for test in test_names), dtype=np.float64, count=len(test_names))
         
-        # 计算加速比
-        speedups = [pure_times[i] / summary_times[i] if summary_times[i] > 0 else 0 
-                   for i in range(len(test_names))]
+        # 计算加速比（summary耗时为0的用例记为0）
+        speedups = np.zeros_like(pure_times)
+        np.divide(pure_times, summary_times, out=speedups, where=summary_times > 0)
+        mean_speedup = speedups.mean()
         
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
         
@@ -115,8 +117,8 @@ class AcademicChartGenerator:
         
         # 右图：加速比分布
         ax2.hist(speedups, bins=20, alpha=0.7, edgecolor='black')
-        ax2.axvline(np.mean(speedups), color='red', linestyle='--', 
-                   label=f'Mean: {np.mean(speedups):.2f}x')
+        ax2.axvline(mean_speedup, color='red', linestyle='--', 
+                   label=f'Mean: {mean_speedup:.2f}x')
         ax2.set_xlabel('Speedup Ratio')
         ax2.set_ylabel('Frequency')
         ax2.set_title('Speedup Distribution')
@@ -384,24 +386,19 @@ class AcademicChartGenerator:
             self.console.print("[yellow]Warning: No common test cases found[/yellow]")
             return ""
         
-        # 计算加速因子和性能提升
-        speedup_factors = []
-        performance_improvements = []
+        # 计算加速因子和性能提升（只统计summary耗时大于0的用例）
+        pure_durations = np.fromiter((pure_data[test] for test in common_tests), dtype=np.float64, count=len(common_tests))
+        summary_durations = np.fromiter((summary_data[test] for test in common_tests), dtype=np.float64, count=len(common_tests))
+        valid = summary_durations > 0
+        pure_durations = pure_durations[valid]
+        summary_durations = summary_durations[valid]
+        speedup_factors = pure_durations / summary_durations
         
-        for test_name in common_tests:
-            pure_duration = pure_data[test_name]
-            summary_duration = summary_data[test_name]
-            
-            if summary_duration > 0:
-                speedup_factor = pure_duration / summary_duration
-                speedup_factors.append(speedup_factor)
-                
-                # 性能提升百分比 = (pure_duration - summary_duration) / pure_duration * 100
-                if pure_duration > 0:
-                    improvement = ((pure_duration - summary_duration) / pure_duration) * 100
-                    performance_improvements.append(improvement)
+        # 性能提升百分比 = (pure_duration - summary_duration) / pure_duration * 100
+        improved = pure_durations > 0
+        performance_improvements = (pure_durations[improved] - summary_durations[improved]) / pure_durations[improved] * 100
         
-        if not speedup_factors:
+        if not speedup_factors.size:
             self.console.print("[yellow]Warning: No valid speedup factors calculated[/yellow]")
             return ""
         
@@ -410,8 +407,9 @@ class AcademicChartGenerator:
         
         # 左图：加速因子分布
         ax1.hist(speedup_factors, bins=20, alpha=0.7, color='green', edgecolor='black')
-        ax1.axvline(np.mean(speedup_factors), color='red', linestyle='--', 
-                   label=f'Mean: {np.mean(speedup_factors):.2f}x')
+        mean_speedup = speedup_factors.mean()
+        ax1.axvline(mean_speedup, color='red', linestyle='--', 
+                   label=f'Mean: {mean_speedup:.2f}x')
         ax1.set_xlabel('Speedup Factor')
         ax1.set_ylabel('Number of Test Cases')
         ax1.set_title('Distribution of Speedup Factors')
@@ -419,10 +417,11 @@ class AcademicChartGenerator:
         ax1.grid(True, alpha=0.3)
         
         # 右图：性能提升分布
-        if performance_improvements:
+        if performance_improvements.size:
+            mean_improvement = performance_improvements.mean()
             ax2.hist(performance_improvements, bins=20, alpha=0.7, color='red', edgecolor='black')
-            ax2.axvline(np.mean(performance_improvements), color='blue', linestyle='--', 
-                       label=f'Mean: {np.mean(performance_improvements):.1f}%')
+            ax2.axvline(mean_improvement, color='blue', linestyle='--', 
+                       label=f'Mean: {mean_improvement:.1f}%')
             ax2.set_xlabel('Performance Improvement (%)')
             ax2.set_ylabel('Number of Test Cases')
             ax2.set_title('Distribution of Performance Improvements')
@@ -536,9 +535,8 @@ class AcademicChartGenerator:
             self.console.print("[yellow]Warning: No valid speedup factors calculated[/yellow]")
             return ""
         
-        # 按加速因子排序，取前N个
-        test_improvements.sort(key=lambda x: x[1], reverse=True)
-        top_improvements = test_improvements[:top_n]
+        # 只需要加速因子最大的前N个，不必对全部用例排序
+        top_improvements = heapq.nlargest(top_n, test_improvements, key=lambda x: x[1])
         
         # 准备数据
         test_names = [item[0] for item in top_improvements]
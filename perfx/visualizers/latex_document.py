@@ -7,6 +7,7 @@ into a single LaTeX document and compile it to PDF.
 """
 
 import os
+import re
 import subprocess
 import tempfile
 from pathlib import Path
@@ -198,7 +199,7 @@ class LatexDocumentGenerator:
         try:
             # Check if pdflatex is available
             result = subprocess.run(['which', 'pdflatex'], 
-                                  capture_output=True, text=True, timeout=10)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
             if result.returncode != 0:
                 console.print("[yellow]⚠ pdflatex not found. PDF compilation skipped.[/yellow]")
                 return False
@@ -206,7 +207,7 @@ class LatexDocumentGenerator:
             # Compile LaTeX to PDF
             console.print(f"[blue]Compiling LaTeX to PDF: {latex_file}[/blue]")
             
-            # Run pdflatex twice to resolve references
+            # Run pdflatex twice to resolve references; its verbose stdout is also in the .log file
             for run in range(2):
                 try:
                     result = subprocess.run([
@@ -214,7 +215,8 @@ class LatexDocumentGenerator:
                         '-interaction=nonstopmode',
                         '-output-directory=' + str(latex_file.parent),
                         str(latex_file)
-                    ], capture_output=True, text=True, cwd=latex_file.parent, timeout=60)
+                    ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                       cwd=latex_file.parent, timeout=60)
                     
                     if result.returncode != 0:
                         console.print(f"[red]✗ LaTeX compilation failed (run {run + 1}):[/red]")
@@ -279,7 +281,6 @@ class LatexDocumentGenerator:
             r'\\hypersetup\{[^}]*\}'
         ]
         
-        import re
         for pattern in problematic_commands:
             content = re.sub(pattern, '', content)
         
@@ -290,7 +291,6 @@ class LatexDocumentGenerator:
     
     def _clean_simple_table_content(self, content: str) -> str:
         """Clean simple table content (files without document structure)"""
-        import re
         
         # For simple table files, we only remove extra blank lines
         # and ensure proper spacing
@@ -132,6 +132,39 @@ class TestDependencyManager:
         changed = dep_manager.check_dependencies_changed("test_step", dependencies)
         assert changed is False
     
+    def test_directory_scratch_files_do_not_invalidate(self, dep_manager, temp_dir):
+        """Test that editing a directory and restoring its files keeps the step cached"""
+        test_dir = temp_dir / "test_dir"
+        test_dir.mkdir()
+        
+        py_file = test_dir / "interpreter.py"
+        py_file.write_text("kdist.get('evm-semantics.llvm')")
+        
+        dependencies = [
+            {"path": str(test_dir), "type": "directory", "pattern": "*.py"}
+        ]
+        
+        dep_manager.check_dependencies_changed("test_step", dependencies)
+        dep_manager.mark_step_completed("test_step")
+        
+        # Two steps edit the file in place and restore it from a backup (sed -i.bak, then mv)
+        for mode in ("llvm-pure", "llvm-summary"):
+            backup_file = test_dir / "interpreter.py.bak"
+            py_file.rename(backup_file)
+            py_file.write_text(f"kdist.get('evm-semantics.{mode}')")
+            backup_file.replace(py_file)
+            dir_mtime = test_dir.stat().st_mtime + 10
+            os.utime(test_dir, (dir_mtime, dir_mtime))
+            
+            changed = dep_manager.check_dependencies_changed("test_step", dependencies)
+            assert changed is False
+            dep_manager.mark_step_completed("test_step")
+        
+        # A real edit of a matching file is still detected
+        py_file.write_text("kdist.get('evm-semantics.llvm')  # changed")
+        changed = dep_manager.check_dependencies_changed("test_step", dependencies)
+        assert changed is True
+    
     def test_multiple_dependencies(self, dep_manager, temp_dir):
         """Test multiple dependencies"""
         file1 = temp_dir / "file1.txt"
@@ -200,6 +233,41 @@ class TestDependencyManager:
         changed = dep_manager.check_dependencies_changed("test_step", dependencies)
         assert changed is True
     
+    def test_mark_step_completed_keeps_unchanged_dependencies_cached(self, dep_manager, temp_dir):
+        """Test that a completed step is skipped on the next check if nothing changed"""
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("content")
+        
+        dependencies = [
+            {"path": str(test_file), "type": "file"}
+        ]
+        
+        dep_manager.check_dependencies_changed("test_step", dependencies)
+        dep_manager.mark_step_completed("test_step")
+        
+        changed = dep_manager.check_dependencies_changed("test_step", dependencies)
+        assert changed is False
+    
+    def test_check_without_completion_is_not_persisted(self, dep_manager, temp_dir):
+        """Test that a step that never completed is not skipped by the next run"""
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("content")
+        
+        dependencies = [
+            {"path": str(test_file), "type": "file"}
+        ]
+        
+        dep_manager.check_dependencies_changed("test_step", dependencies)
+        
+        # The step failed or was interrupted: a new run starts from the cache file
+        next_run = DependencyManager(str(dep_manager.cache_file))
+        changed = next_run.check_dependencies_changed("test_step", dependencies)
+        assert changed is True
+        
+        next_run.mark_step_completed("test_step")
+        changed = DependencyManager(str(dep_manager.cache_file)).check_dependencies_changed("test_step", dependencies)
+        assert changed is False
+    
     def test_clear_cache(self, dep_manager, temp_dir):
         """Test clearing cache"""
         test_file = temp_dir / "test.txt"
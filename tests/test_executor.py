@@ -188,3 +188,42 @@ class TestEvaluationExecutor:
             assert success is True
             assert len(executor.recorder.results["commands"]) == 2
             assert len(executor.recorder.results["steps"]) == 2
+
+    def test_failed_step_is_not_cached(self, sample_config, temp_dir):
+        """Test that a failed step with dependencies runs again on the next run"""
+        dependency = temp_dir / "input.txt"
+        dependency.write_text("content")
+        sample_config["global"]["dependency_cache"] = str(temp_dir / "cache.json")
+        sample_config["steps"][0]["dependencies"] = [{"path": str(dependency), "type": "file"}]
+        output_dir = str(temp_dir / "output")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=1, stdout="", stderr="Command failed"
+            )
+            assert EvaluationExecutor(sample_config, output_dir).run() is False
+
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="Hello, World!\n", stderr=""
+            )
+            executor = EvaluationExecutor(sample_config, output_dir)
+            assert executor.run() is True
+            assert len(executor.recorder.results["commands"]) == 1
+
+            # Once the step succeeded, unchanged dependencies skip it
+            executor = EvaluationExecutor(sample_config, output_dir)
+            assert executor.run() is True
+            assert len(executor.recorder.results["commands"]) == 0
+
+    def test_recorder_truncates_long_output(self):
+        """Test that recorded command output keeps only its head and tail"""
+        recorder = EvaluationRecorder()
+        output = "a" * 70000 + "b" * 70000
+
+        recorder.add_command("pytest", output=output, error="short")
+
+        record = recorder.results["commands"][0]
+        assert record["output"].startswith("a" * 65536)
+        assert record["output"].endswith("b" * 65536)
+        assert "[8928 characters elided]" in record["output"]
+        assert record["error"] == "short"
@@ -0,0 +1,80 @@
+"""
+Tests for the EDSL spec module replacer script
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "eval-evm-summary" / "replace_edsl_in_specs.py"
+
+
+def run_script(*args) -> subprocess.CompletedProcess:
+    """Run replace_edsl_in_specs.py with the given arguments"""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args], capture_output=True, text=True
+    )
+
+
+class TestReplaceEdslInSpecs:
+    """Test cases for rewriting and restoring spec files"""
+
+    @pytest.fixture
+    def spec_tree(self, temp_dir):
+        """Spec tree with small, nested, large and EDSL-free files"""
+        specs = temp_dir / "specs"
+        (specs / "nested").mkdir(parents=True)
+        originals = {
+            "small-spec.k": b"requires \"edsl.md\"\nmodule SMALL-SPEC\n    imports EDSL\nendmodule\n",
+            "nested/nested-spec.k": b"module NESTED-SPEC\n    imports EDSL\n    imports EDSL\nendmodule\n",
+            # Larger than the plain-read prefix, with the only occurrence near the end
+            "large-spec.k": b"// padding\n" * 8000 + b"module LARGE-SPEC\n    imports EDSL\nendmodule\n",
+            "plain.k": b"module PLAIN\n    imports INT\nendmodule\n",
+        }
+        for name, content in originals.items():
+            (specs / name).write_bytes(content)
+        return specs, temp_dir / "backups", originals
+
+    @pytest.mark.parametrize("target", ["EDSL-PURE", "EDSL-SUMMARY", "ABCD"])
+    def test_rewrite_and_restore(self, spec_tree, target):
+        """Test rewriting specs, checking the backups and restoring byte-identical files"""
+        specs, backups, originals = spec_tree
+
+        result = run_script("--specs-dir", str(specs), "--backup-dir", str(backups), "--target", target)
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "in 3 files" in result.stdout
+
+        for name, content in originals.items():
+            expected = content.replace(b"EDSL\n", target.encode() + b"\n")
+            assert (specs / name).read_bytes() == expected
+            if expected != content:
+                assert (backups / name).read_bytes() == content
+            else:
+                assert not (backups / name).exists()
+
+        result = run_script("--specs-dir", str(specs), "--backup-dir", str(backups), "--restore")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Restored 3 spec files" in result.stdout
+
+        for name, content in originals.items():
+            assert (specs / name).read_bytes() == content
+        assert not backups.exists()
+
+    def test_rewrite_twice_keeps_first_backup(self, spec_tree):
+        """Test a second rewrite does not overwrite the original backup"""
+        specs, backups, originals = spec_tree
+
+        run_script("--specs-dir", str(specs), "--backup-dir", str(backups), "--target", "EDSL-PURE")
+        run_script("--specs-dir", str(specs), "--backup-dir", str(backups), "--target", "EDSL-PURE")
+        run_script("--specs-dir", str(specs), "--backup-dir", str(backups), "--restore")
+
+        for name, content in originals.items():
+            assert (specs / name).read_bytes() == content
+
+    def test_missing_specs_dir(self, temp_dir):
+        """Test a missing specs directory is reported as a failure"""
+        result = run_script("--specs-dir", str(temp_dir / "missing"), "--target", "EDSL-PURE")
+        assert result.returncode == 1
+        assert "does not exist" in result.stdout